@@ -8,6 +8,8 @@ from models.database import Base
 from models.asset import Asset
 from models.category import Category
 from models.asset_history import AssetHistory
+from models.asset_stats import AssetStats
+from models.asset_tombstone import AssetTombstone
 
 config = context.config
 
@@ -17,6 +19,9 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 def get_url():
+    configured_url = config.get_main_option("sqlalchemy.url")
+    if configured_url:
+        return configured_url
     mysql_host = os.getenv("MYSQL_HOST", "mysql-shared")
     mysql_port = os.getenv("MYSQL_PORT", "3306")
     mysql_user = os.getenv("MYSQL_USER", "root")
@@ -0,0 +1,22 @@
+"""Add asset sort indexes
+
+Revision ID: c2d9e8f1a7b3
+Revises: b7f3c4d5e6a1
+Create Date: 2024-01-03 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'c2d9e8f1a7b3'
+down_revision = 'b7f3c4d5e6a1'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_index(op.f('ix_assets_created_at'), 'assets', ['created_at'], unique=False)
+    op.create_index(op.f('ix_assets_updated_at'), 'assets', ['updated_at'], unique=False)
+
+def downgrade():
+    op.drop_index(op.f('ix_assets_updated_at'), table_name='assets')
+    op.drop_index(op.f('ix_assets_created_at'), table_name='assets')
\ No newline at end of file
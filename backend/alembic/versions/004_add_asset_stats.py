@@ -0,0 +1,33 @@
+"""Add asset stats snapshot
+
+Revision ID: d4a1f6b9c2e8
+Revises: c2d9e8f1a7b3
+Create Date: 2024-01-04 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'd4a1f6b9c2e8'
+down_revision = 'c2d9e8f1a7b3'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'asset_stats',
+        sa.Column('status', sa.String(length=50), nullable=False),
+        sa.Column('category_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('asset_count', sa.Integer(), nullable=False),
+        sa.Column('total_value', sa.Double(), nullable=False),
+        sa.PrimaryKeyConstraint('status', 'category_id'),
+        if_not_exists=True,
+    )
+    op.execute(
+        "INSERT INTO asset_stats (status, category_id, asset_count, total_value) "
+        "SELECT status, category_id, COUNT(*), COALESCE(SUM(current_value), 0) "
+        "FROM assets GROUP BY status, category_id"
+    )
+
+def downgrade():
+    op.drop_table('asset_stats')
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""Add access path indexes
+
+Revision ID: e6b3c8d2f4a9
+Revises: d4a1f6b9c2e8
+Create Date: 2024-01-05 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'e6b3c8d2f4a9'
+down_revision = 'd4a1f6b9c2e8'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_index(op.f('ix_assets_status'), 'assets', ['status'], unique=False)
+    op.create_index('ix_assets_category_id_status', 'assets', ['category_id', 'status'], unique=False)
+    op.create_index('ix_asset_history_asset_id_timestamp', 'asset_history', ['asset_id', 'timestamp'], unique=False)
+    op.create_index(op.f('ix_asset_history_timestamp'), 'asset_history', ['timestamp'], unique=False)
+
+def downgrade():
+    op.drop_index(op.f('ix_asset_history_timestamp'), table_name='asset_history')
+    op.drop_index('ix_asset_history_asset_id_timestamp', table_name='asset_history')
+    op.drop_index('ix_assets_category_id_status', table_name='assets')
+    op.drop_index(op.f('ix_assets_status'), table_name='assets')
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""Add asset full-text search index
+
+Revision ID: f1c7a9e3b5d2
+Revises: e6b3c8d2f4a9
+Create Date: 2024-01-06 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'f1c7a9e3b5d2'
+down_revision = 'e6b3c8d2f4a9'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_index(
+        'ft_assets_search',
+        'assets',
+        ['name', 'description', 'location', 'assigned_to'],
+        unique=False,
+        mysql_prefix='FULLTEXT',
+    )
+
+def downgrade():
+    op.drop_index('ft_assets_search', table_name='assets')
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""Add asset history change sets
+
+Revision ID: a8d2e5f7c1b4
+Revises: f1c7a9e3b5d2
+Create Date: 2024-01-07 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'a8d2e5f7c1b4'
+down_revision = 'f1c7a9e3b5d2'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('asset_history', sa.Column('changes', sa.JSON(), nullable=True))
+
+def downgrade():
+    op.drop_column('asset_history', 'changes')
\ No newline at end of file
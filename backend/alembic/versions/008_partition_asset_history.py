@@ -0,0 +1,53 @@
+"""Partition asset history by month
+
+Revision ID: b5e9f2a4d6c8
+Revises: a8d2e5f7c1b4
+Create Date: 2024-01-08 00:00:00.000000
+
+"""
+from datetime import date, datetime
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'b5e9f2a4d6c8'
+down_revision = 'a8d2e5f7c1b4'
+branch_labels = None
+depends_on = None
+
+PARTITIONS_AHEAD = 3
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+def _partition_clauses(first: date, last: date):
+    clauses = []
+    month = first
+    while month <= last:
+        upper = _add_months(month, 1)
+        clauses.append(f"PARTITION p{month:%Y%m} VALUES LESS THAN ('{upper.isoformat()}')")
+        month = upper
+    clauses.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+    return clauses
+
+def upgrade():
+    bind = op.get_bind()
+    for foreign_key in sa.inspect(bind).get_foreign_keys('asset_history'):
+        op.drop_constraint(foreign_key['name'], 'asset_history', type_='foreignkey')
+
+    op.execute("ALTER TABLE asset_history DROP PRIMARY KEY, ADD PRIMARY KEY (id, timestamp)")
+
+    oldest = bind.execute(sa.text("SELECT MIN(timestamp) FROM asset_history")).scalar()
+    this_month = datetime.utcnow().date().replace(day=1)
+    first = oldest.date().replace(day=1) if oldest else this_month
+    last = _add_months(this_month, PARTITIONS_AHEAD)
+    op.execute(
+        "ALTER TABLE asset_history PARTITION BY RANGE COLUMNS(timestamp) ("
+        + ", ".join(_partition_clauses(first, last))
+        + ")"
+    )
+
+def downgrade():
+    op.execute("ALTER TABLE asset_history REMOVE PARTITIONING")
+    op.execute("ALTER TABLE asset_history DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
+    op.create_foreign_key(None, 'asset_history', 'assets', ['asset_id'], ['id'])
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""Add asset tombstones for the change feed
+
+Revision ID: c3f8a1d7e9b2
+Revises: b5e9f2a4d6c8
+Create Date: 2024-01-09 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'c3f8a1d7e9b2'
+down_revision = 'b5e9f2a4d6c8'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'asset_tombstones',
+        sa.Column('asset_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('asset_id'),
+    )
+    op.create_index('ix_asset_tombstones_deleted_at_asset_id', 'asset_tombstones', ['deleted_at', 'asset_id'])
+
+def downgrade():
+    op.drop_index('ix_asset_tombstones_deleted_at_asset_id', table_name='asset_tombstones')
+    op.drop_table('asset_tombstones')
\ No newline at end of file
@@ -0,0 +1,120 @@
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import aiohttp
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The unpaged list keeps one large response in the mix, so the run shows
+# whether it stalls the small requests behind it.
+DEFAULT_PATHS = ["/api/assets?limit=50", "/api/dashboard/summary", "/api/categories", "/api/assets"]
+
+def percentile(values, fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def summarize(latencies) -> dict:
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+    }
+
+async def worker(session, base_url: str, paths, deadline: float, latencies: list, errors: list, offset: int):
+    index = offset
+    while time.perf_counter() < deadline:
+        path = paths[index % len(paths)]
+        index += 1
+        started = time.perf_counter()
+        try:
+            async with session.get(base_url + path) as response:
+                await response.read()
+                if response.status >= 400:
+                    errors.append(response.status)
+                    continue
+        except aiohttp.ClientError as e:
+            errors.append(type(e).__name__)
+            continue
+        latencies.append((path, time.perf_counter() - started))
+
+async def run_load(base_url: str, paths, concurrency: int, duration: float) -> dict:
+    latencies, errors = [], []
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    # A cookie jar would carry db_primary_until between requests and pin reads to the primary.
+    async with aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar()) as session:
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*[
+            worker(session, base_url, paths, deadline, latencies, errors, offset)
+            for offset in range(concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+    return {
+        **summarize([seconds for _, seconds in latencies]),
+        "errors": len(errors),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "paths": {path: summarize([seconds for other, seconds in latencies if other == path]) for path in paths},
+    }
+
+async def wait_until_ready(base_url: str, timeout: float = 60):
+    deadline = time.perf_counter() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.perf_counter() < deadline:
+            try:
+                async with session.get(base_url + "/") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.5)
+    raise SystemExit(f"Server at {base_url} did not become ready")
+
+def start_server(db_async: bool, port: int, workers: int) -> subprocess.Popen:
+    env = dict(os.environ, DB_ASYNC="true" if db_async else "false", STARTUP_MIGRATIONS="off")
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+
+async def run_url(base_url: str, args) -> dict:
+    await wait_until_ready(base_url)
+    return await run_load(base_url, args.paths, args.concurrency, args.duration)
+
+async def compare(args) -> dict:
+    results = {}
+    for mode in ("sync", "async"):
+        server = start_server(mode == "async", args.port, args.workers)
+        try:
+            base_url = f"http://127.0.0.1:{args.port}"
+            await wait_until_ready(base_url)
+            results[mode] = await run_load(base_url, args.paths, args.concurrency, args.duration)
+        finally:
+            server.terminate()
+            server.wait()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the read API in sync and async database modes")
+    parser.add_argument("--url", help="Test an already running server instead of starting one per mode")
+    parser.add_argument("--paths", nargs="+", default=DEFAULT_PATHS, help="Request paths, cycled per worker")
+    parser.add_argument("--concurrency", type=int, default=200, help="Concurrent client connections")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of load per run")
+    parser.add_argument("--port", type=int, default=8055, help="Port for servers started by the comparison")
+    parser.add_argument("--workers", type=int, default=1, help="Uvicorn workers per started server")
+    args = parser.parse_args()
+
+    if args.url:
+        results = asyncio.run(run_url(args.url.rstrip("/"), args))
+    else:
+        results = asyncio.run(compare(args))
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
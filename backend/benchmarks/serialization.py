@@ -0,0 +1,97 @@
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import date, datetime
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from models.asset import Asset
+from models.category import Category
+from schemas.asset import AssetResponse
+from services.asset_loader import asset_column_query, asset_load_options, serialize_asset_rows, serialize_assets
+from services.fast_json import dumps
+
+asset_list = TypeAdapter(List[AssetResponse])
+
+def seed(session_factory, count: int):
+    now = datetime.utcnow()
+    with session_factory() as db:
+        db.add_all([Category(name=f"Category {index}") for index in range(5)])
+        db.flush()
+        db.execute(insert(Asset), [
+            {
+                "name": f"Asset {index}",
+                "description": "Standard issue equipment",
+                "serial_number": f"SN-{index:06d}",
+                "category_id": index % 5 + 1,
+                "purchase_price": index * 2.0,
+                "current_value": index * 1.5,
+                "purchase_date": date(2024, 1, 1),
+                "status": "Active",
+                "location": "HQ",
+                "assigned_to": "Operations",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for index in range(count)
+        ])
+        db.commit()
+
+def orm_pydantic(db) -> bytes:
+    rows = db.query(Asset).options(*asset_load_options()).order_by(Asset.id).all()
+    return asset_list.dump_json(serialize_assets(db, rows))
+
+def orm_stdlib_json(db) -> bytes:
+    rows = db.query(Asset).options(*asset_load_options()).order_by(Asset.id).all()
+    return json.dumps(jsonable_encoder(serialize_assets(db, rows))).encode()
+
+def rows_orjson(db) -> bytes:
+    rows = asset_column_query(db).order_by(Asset.id).all()
+    return dumps(serialize_asset_rows(db, rows))
+
+CASES = [
+    ("before: ORM + Pydantic dump_json", orm_pydantic),
+    ("before: ORM + jsonable_encoder/json", orm_stdlib_json),
+    ("after: column rows + orjson", rows_orjson),
+]
+
+def best_of(session_factory, func, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        with session_factory() as db:
+            started = time.perf_counter()
+            body = func(db)
+            timings.append(time.perf_counter() - started)
+    return min(timings), body
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare asset list serialization cost before and after the fast JSON path")
+    parser.add_argument("--assets", type=int, default=10000, help="Number of assets to serialize")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case; the best is reported")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Category.__table__.create(engine)
+    Asset.__table__.create(engine)
+    session_factory = sessionmaker(bind=engine)
+    seed(session_factory, args.assets)
+
+    body = b""
+    for label, func in CASES:
+        seconds, body = best_of(session_factory, func, args.repeat)
+        print(f"{label:40} {seconds * 1000:8.1f} ms  {len(body):>10} bytes")
+    started = time.perf_counter()
+    compressed = gzip.compress(body, 6)
+    print(f"{'gzip level 6 of the fast path body':40} {(time.perf_counter() - started) * 1000:8.1f} ms  {len(compressed):>10} bytes")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,14 +1,24 @@
 import os
-from fastapi import FastAPI
+import time
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import text
-from alembic import command
-from alembic.config import Config
-from models.database import engine, SessionLocal, MYSQL_DB, DATABASE_URL
-from routers import assets, categories, dashboard, files
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES, GZipMiddleware
+from models.database import async_engine, ensure_database_exists, replica_set, PRIMARY_STICKY_COOKIE, PRIMARY_STICKY_SECONDS
+from routers import assets, categories, dashboard, files, system
+from services.dashboard_events import dashboard_broadcaster
+from services.dashboard_stats import start_reconciler
+from services.history_writer import history_writer
+from services.metrics import MetricsMiddleware, render_metrics
+from services.migrations import run_migrations, schema_is_current, seed_default_categories
 
 app = FastAPI(title="Asset Management API")
 
+STARTUP_MIGRATIONS = os.getenv("STARTUP_MIGRATIONS", "auto").lower()
+RESPONSE_COMPRESSION = os.getenv("RESPONSE_COMPRESSION", "gzip").lower()
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+COMPRESSION_LEVEL = int(os.getenv("COMPRESSION_LEVEL", "6"))
+
 app_id = os.getenv("APP_ID", "")
 preview_domain = os.getenv("PREVIEW_DOMAIN", "")
 preview_scheme = "https" if os.getenv("PREVIEW_USE_HTTPS", "false").lower() == "true" else "http"
@@ -37,49 +47,85 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-def run_startup_migrations():
-    lock_name = f"migration_lock_{MYSQL_DB}"
-    with engine.connect() as conn:
-        acquired = conn.execute(
-            text("SELECT GET_LOCK(:lock_name, 60)"),
-            {"lock_name": lock_name},
-        ).scalar()
-        if not acquired:
-            raise RuntimeError("Could not acquire migration lock")
-        try:
-            alembic_cfg = Config("alembic.ini")
-            alembic_cfg.set_main_option("sqlalchemy.url", DATABASE_URL)
-            command.upgrade(alembic_cfg, "head")
-        finally:
-            conn.execute(
-                text("SELECT RELEASE_LOCK(:lock_name)"),
-                {"lock_name": lock_name},
-            )
+if RESPONSE_COMPRESSION == "gzip":
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=COMPRESSION_MIN_BYTES,
+        compresslevel=COMPRESSION_LEVEL,
+        exclude_content_types=DEFAULT_EXCLUDED_CONTENT_TYPES + ("application/vnd.apache.parquet",),
+    )
+
+app.add_middleware(MetricsMiddleware)
+
+@app.middleware("http")
+async def stick_to_primary_after_writes(request: Request, call_next):
+    response = await call_next(request)
+    if replica_set is not None and request.method in ("POST", "PUT", "PATCH", "DELETE") and response.status_code < 400:
+        response.set_cookie(
+            PRIMARY_STICKY_COOKIE,
+            str(time.time() + PRIMARY_STICKY_SECONDS),
+            max_age=PRIMARY_STICKY_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
+    return response
+
+@app.middleware("http")
+async def reject_oversized_uploads(request: Request, call_next):
+    if request.method == "POST" and request.url.path == files.UPLOAD_PATH:
+        error = files.upload_length_error(request.headers.get("content-length"))
+        if error is not None:
+            return JSONResponse({"detail": error.detail}, status_code=error.status_code)
+    return await call_next(request)
+
+def timed(timings: dict, phase: str, func):
+    started = time.perf_counter()
+    result = func()
+    timings[phase] = round((time.perf_counter() - started) * 1000, 1)
+    return result
 
 @app.on_event("startup")
 def startup_event():
-    run_startup_migrations()
+    started = time.perf_counter()
+    timings = {}
+    if timed(timings, "schema_check", schema_is_current):
+        timings["migrations"] = "skipped"
+    elif STARTUP_MIGRATIONS == "auto":
+        timed(timings, "ensure_database", ensure_database_exists)
+        timed(timings, "migrations", run_migrations)
+        timed(timings, "seed", seed_default_categories)
+    else:
+        print("Warning: Database schema is behind the migration head; run `python manage.py migrate`")
+        timings["migrations"] = "pending"
+    
+    timed(timings, "reconciler", start_reconciler)
+    if replica_set is not None:
+        timed(timings, "replicas", replica_set.start)
     
-    db = SessionLocal()
-    try:
-        from models.category import Category
-        if db.query(Category).count() == 0:
-            default_categories = [
-                Category(name="Electronics", description="Electronic devices and equipment"),
-                Category(name="Furniture", description="Office and home furniture"),
-                Category(name="Vehicles", description="Company vehicles and transportation"),
-                Category(name="Software", description="Software licenses and subscriptions"),
-                Category(name="Equipment", description="General equipment and tools"),
-            ]
-            db.add_all(default_categories)
-            db.commit()
-    finally:
-        db.close()
+    total = round((time.perf_counter() - started) * 1000, 1)
+    print(f"Startup completed in {total} ms: " + ", ".join(f"{phase}={value}" for phase, value in timings.items()))
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await files.close_blob_service_client()
+    await dashboard_broadcaster.stop()
+    if async_engine is not None:
+        await async_engine.dispose()
+    if history_writer is not None:
+        history_writer.stop()
+    if replica_set is not None:
+        replica_set.stop()
 
 app.include_router(assets.router)
 app.include_router(categories.router)
 app.include_router(dashboard.router)
 app.include_router(files.router)
+app.include_router(system.router)
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
 
 @app.get("/")
 def root():
@@ -0,0 +1,71 @@
+import argparse
+import json
+from models.database import engine, ensure_database_exists, SessionLocal
+from services.history_partitions import (
+    HISTORY_ARCHIVE_DIR,
+    HISTORY_PARTITIONS_AHEAD,
+    HISTORY_RETENTION_MONTHS,
+    expire_partitions,
+    roll_forward,
+)
+from services.change_feed import TOMBSTONE_RETENTION_DAYS, prune_tombstones
+from services.migrations import run_migrations, schema_is_current, seed_default_categories
+
+def migrate(args):
+    ensure_database_exists()
+    if schema_is_current():
+        print("Schema is already at the migration head")
+    else:
+        run_migrations()
+        print("Schema upgraded to the migration head")
+    if not args.no_seed:
+        print(f"Seeded {seed_default_categories()} default categories")
+
+def rotate_history(args):
+    if args.retention_months > 0 and not args.archive_dir and not args.no_archive:
+        raise SystemExit("Set HISTORY_ARCHIVE_DIR (or --archive-dir) or pass --no-archive to drop without archiving")
+    with engine.connect() as conn:
+        created = roll_forward(conn, args.ahead, args.dry_run)
+        expired = expire_partitions(
+            conn,
+            args.retention_months,
+            "" if args.no_archive else args.archive_dir,
+            args.dry_run,
+        )
+        conn.commit()
+    print(json.dumps({"created": created, "expired": expired, "dry_run": args.dry_run}, indent=2))
+
+def prune_asset_tombstones(args):
+    db = SessionLocal()
+    try:
+        deleted = prune_tombstones(db, args.retention_days)
+        db.commit()
+    finally:
+        db.close()
+    print(f"Pruned {deleted} asset tombstones")
+
+def main():
+    parser = argparse.ArgumentParser(description="Asset Management maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser("migrate", help="Create the database if needed, upgrade to the migration head and seed defaults")
+    migrate_parser.add_argument("--no-seed", action="store_true", help="Skip seeding default categories")
+    migrate_parser.set_defaults(handler=migrate)
+
+    rotate = commands.add_parser("rotate-history", help="Add upcoming asset_history partitions and archive expired ones")
+    rotate.add_argument("--ahead", type=int, default=HISTORY_PARTITIONS_AHEAD, help="Months of partitions to keep ahead of now")
+    rotate.add_argument("--retention-months", type=int, default=HISTORY_RETENTION_MONTHS, help="Months of history to keep (0 keeps everything)")
+    rotate.add_argument("--archive-dir", default=HISTORY_ARCHIVE_DIR, help="Directory for compressed NDJSON archives")
+    rotate.add_argument("--no-archive", action="store_true", help="Drop expired partitions without archiving them")
+    rotate.add_argument("--dry-run", action="store_true", help="Report what would change without altering the table")
+    rotate.set_defaults(handler=rotate_history)
+
+    prune = commands.add_parser("prune-tombstones", help="Delete change feed tombstones past their retention")
+    prune.add_argument("--retention-days", type=int, default=TOMBSTONE_RETENTION_DAYS, help="Days of tombstones to keep")
+    prune.set_defaults(handler=prune_asset_tombstones)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
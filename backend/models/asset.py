@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, Index, Text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from models.database import Base
 
 class Asset(Base):
     __tablename__ = "assets"
+    __table_args__ = (
+        Index("ix_assets_category_id_status", "category_id", "status"),
+        Index("ft_assets_search", "name", "description", "location", "assigned_to", mysql_prefix="FULLTEXT"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False, index=True)
@@ -13,13 +17,22 @@ class Asset(Base):
     purchase_date = Column(Date, nullable=True)
     purchase_price = Column(Float, nullable=True)
     current_value = Column(Float, nullable=True)
-    status = Column(String(50), nullable=False, default="Active")
+    status = Column(String(50), nullable=False, default="Active", index=True)
     location = Column(String(255), nullable=True)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
     assigned_to = Column(String(255), nullable=True)
     image_path = Column(String(512), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True)
 
     category = relationship("Category", back_populates="assets")
-    history = relationship("AssetHistory", back_populates="asset", cascade="all, delete-orphan")
\ No newline at end of file
+    history = relationship(
+        "AssetHistory",
+        back_populates="asset",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        primaryjoin="Asset.id == foreign(AssetHistory.asset_id)",
+    )
+
+from models.category import Category
+from models.asset_history import AssetHistory
\ No newline at end of file
@@ -1,15 +1,25 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Index, JSON, Text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from models.database import Base
 
 class AssetHistory(Base):
     __tablename__ = "asset_history"
+    __table_args__ = (
+        Index("ix_asset_history_asset_id_timestamp", "asset_id", "timestamp"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    asset_id = Column(Integer, ForeignKey("assets.id"), nullable=False)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    asset_id = Column(Integer, nullable=False)
     action = Column(String(50), nullable=False)
     details = Column(Text, nullable=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    changes = Column(JSON, nullable=True)
+    timestamp = Column(DateTime, primary_key=True, default=datetime.utcnow, nullable=False, index=True)
 
-    asset = relationship("Asset", back_populates="history")
\ No newline at end of file
+    asset = relationship(
+        "Asset",
+        back_populates="history",
+        primaryjoin="foreign(AssetHistory.asset_id) == Asset.id",
+    )
+
+from models.asset import Asset
\ No newline at end of file
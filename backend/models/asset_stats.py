@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, String, Double
+from models.database import Base
+
+class AssetStats(Base):
+    __tablename__ = "asset_stats"
+
+    status = Column(String(50), primary_key=True)
+    category_id = Column(Integer, primary_key=True, autoincrement=False)
+    asset_count = Column(Integer, nullable=False, default=0)
+    total_value = Column(Double, nullable=False, default=0)
\ No newline at end of file
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, DateTime, Index
+from datetime import datetime
+from models.database import Base
+
+class AssetTombstone(Base):
+    __tablename__ = "asset_tombstones"
+    __table_args__ = (
+        Index("ix_asset_tombstones_deleted_at_asset_id", "deleted_at", "asset_id"),
+    )
+
+    asset_id = Column(Integer, primary_key=True, autoincrement=False)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
\ No newline at end of file
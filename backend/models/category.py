@@ -11,4 +11,6 @@ class Category(Base):
     description = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
-    assets = relationship("Asset", back_populates="category")
\ No newline at end of file
+    assets = relationship("Asset", back_populates="category")
+
+from models.asset import Asset
\ No newline at end of file
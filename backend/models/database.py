@@ -1,15 +1,33 @@
+import itertools
 import os
+import threading
+import time
 from urllib.parse import quote_plus
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 import pymysql
+from services.pool_metrics import instrument_engine, instrumented_pool_class
 
 MYSQL_HOST = os.getenv("MYSQL_HOST", "mysql-shared")
 MYSQL_PORT = os.getenv("MYSQL_PORT", "3306")
 MYSQL_USER = os.getenv("MYSQL_USER", "root")
 MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "")
 APP_ID = os.getenv("APP_ID", "")
+DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() == "true"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "-1"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_PRE_PING = os.getenv("DB_PRE_PING", "always").lower()
+DB_PRE_PING_IDLE_SECONDS = float(os.getenv("DB_PRE_PING_IDLE_SECONDS", "30"))
+MYSQL_REPLICA_HOSTS = [host.strip() for host in os.getenv("MYSQL_REPLICA_HOSTS", "").split(",") if host.strip()]
+REPLICA_HEALTH_CHECK_SECONDS = float(os.getenv("REPLICA_HEALTH_CHECK_SECONDS", "5"))
+PRIMARY_STICKY_SECONDS = int(os.getenv("PRIMARY_STICKY_SECONDS", "5"))
+PRIMARY_STICKY_COOKIE = "db_primary_until"
 
 MYSQL_DB = os.getenv("MYSQL_DB")
 if not MYSQL_DB:
@@ -30,17 +48,133 @@ def ensure_database_exists():
     except Exception as e:
         print(f"Warning: Could not create database: {e}")
 
-ensure_database_exists()
+def mysql_url(driver: str, host: str, port: str) -> str:
+    return f"mysql+{driver}://{MYSQL_USER}:{quote_plus(MYSQL_PASSWORD)}@{host}:{port}/{MYSQL_DB}"
 
-DATABASE_URL = f"mysql+pymysql://{MYSQL_USER}:{quote_plus(MYSQL_PASSWORD)}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}"
+DATABASE_URL = mysql_url("pymysql", MYSQL_HOST, MYSQL_PORT)
+ASYNC_DATABASE_URL = mysql_url("aiomysql", MYSQL_HOST, MYSQL_PORT)
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+if DB_PRE_PING not in ("always", "idle", "never"):
+    print(f"Warning: Unknown DB_PRE_PING '{DB_PRE_PING}', using 'always'")
+    DB_PRE_PING = "always"
+
+def pool_options(pool_class, name: str) -> dict:
+    return {
+        "poolclass": instrumented_pool_class(pool_class, name),
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_pre_ping": DB_PRE_PING == "always",
+    }
+
+idle_ping_seconds = DB_PRE_PING_IDLE_SECONDS if DB_PRE_PING == "idle" else 0
+
+engine = create_engine(DATABASE_URL, **pool_options(QueuePool, "primary"))
+instrument_engine(engine, idle_ping_seconds)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **pool_options(AsyncAdaptedQueuePool, "primary_async")) if DB_ASYNC else None
+if async_engine is not None:
+    instrument_engine(async_engine.sync_engine, idle_ping_seconds)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False) if DB_ASYNC else None
 Base = declarative_base()
 
+class Replica:
+    def __init__(self, index: int, host: str):
+        hostname, _, port = host.partition(":")
+        self.host = host
+        self.healthy = True
+        self.engine = create_engine(mysql_url("pymysql", hostname, port or MYSQL_PORT), **pool_options(QueuePool, f"replica{index}"))
+        instrument_engine(self.engine, idle_ping_seconds)
+        self.async_engine = None
+        if DB_ASYNC:
+            self.async_engine = create_async_engine(
+                mysql_url("aiomysql", hostname, port or MYSQL_PORT),
+                **pool_options(AsyncAdaptedQueuePool, f"replica{index}_async"),
+            )
+            instrument_engine(self.async_engine.sync_engine, idle_ping_seconds)
+
+class ReplicaSet:
+    def __init__(self, hosts):
+        self.replicas = [Replica(index, host) for index, host in enumerate(hosts)]
+        self._counter = itertools.count()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def pick(self):
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def check(self):
+        for replica in self.replicas:
+            try:
+                with replica.engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                healthy = True
+            except Exception as e:
+                healthy = False
+                if replica.healthy:
+                    print(f"Warning: Replica {replica.host} failed its health check: {e}")
+            if healthy and not replica.healthy:
+                print(f"Replica {replica.host} is healthy again")
+            replica.healthy = healthy
+
+    def start(self, interval: float = REPLICA_HEALTH_CHECK_SECONDS):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="replica-health", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self, interval: float):
+        while not self._stop.wait(interval):
+            self.check()
+
+replica_set = ReplicaSet(MYSQL_REPLICA_HOSTS) if MYSQL_REPLICA_HOSTS else None
+
+def reads_from_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(PRIMARY_STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+def pick_replica(request: Request):
+    if replica_set is None or reads_from_primary(request):
+        return None
+    return replica_set.pick()
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_read_db(request: Request):
+    replica = pick_replica(request)
+    request.state.db_replica = replica.host if replica else None
+    db = SessionLocal(bind=replica.engine) if replica else SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_async_read_db(request: Request):
+    replica = pick_replica(request)
+    request.state.db_replica = replica.host if replica else None
+    session = AsyncSessionLocal(bind=replica.async_engine) if replica else AsyncSessionLocal()
+    async with session as db:
+        yield db
\ No newline at end of file
@@ -1,87 +1,401 @@
-from fastapi import APIRouter, Depends, HTTPException
+import base64
+import json
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import and_, delete, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from models.database import get_db
+from starlette.concurrency import run_in_threadpool
+from typing import List, Literal, Optional
+from models.database import get_db, get_read_db
 from models.asset import Asset
 from models.asset_history import AssetHistory
-from schemas.asset import AssetCreate, AssetUpdate, AssetResponse, AssetHistoryResponse
+from schemas.asset import AssetBulkSelection, AssetBulkUpdate, AssetCreate, AssetUpdate, AssetResponse, AssetHistoryResponse, AssetSnapshotResponse
+from services.asset_loader import asset_categories, asset_column_query, asset_list_query, build_asset_rows, build_assets, get_category_map, load_asset, serialize_asset
+from services.asset_bulk import delete_selected_assets, selection_criteria, update_selected_assets
+from services.asset_export import EXPORT_MEDIA_TYPES, EXPORTERS
+from services.asset_import import RequestBodyReader, import_assets, iter_csv_records, iter_ndjson_records
+from services.asset_search import search_assets
+from services.change_feed import TokenExpired, read_changes, record_tombstones
+from services.dashboard_stats import apply_asset_changes, asset_stats_key
+from services.fast_json import FAST_JSON, FastJSONResponse
+from services.history_diff import diff_asset, reconstruct_asset, snapshot_changes
+from services.history_partitions import history_retained_since
+from services.history_writer import record_history
+from services.response_cache import invalidate_responses
+from routers.db_handler import cached, db_handler, offload
 
 router = APIRouter(prefix="/api/assets", tags=["assets"])
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+MAX_SEARCH_PAGE_SIZE = 100
+MAX_SEARCH_OFFSET = 1000
+
+ASSET_LIST = TypeAdapter(List[AssetResponse])
+HISTORY_LIST = TypeAdapter(List[AssetHistoryResponse])
+
+SORT_COLUMNS = {
+    "id": Asset.id,
+    "name": Asset.name,
+    "created_at": Asset.created_at,
+    "updated_at": Asset.updated_at,
+}
+
+def _encode_cursor(sort: str, order: str, key, asset_id: int) -> str:
+    if isinstance(key, datetime):
+        key = key.isoformat()
+    payload = json.dumps([sort, order, key, asset_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def _decode_cursor(cursor: str, sort: str, order: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, cursor_order, key, asset_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if sort in ("created_at", "updated_at", "timestamp"):
+            key = datetime.fromisoformat(key)
+        asset_id = int(asset_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if cursor_sort != sort or cursor_order != order:
+        raise HTTPException(status_code=400, detail="Cursor does not match the requested sort order")
+    return key, asset_id
+
+def _parse_fields(fields: str) -> List[str]:
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in AssetResponse.model_fields]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return requested
+
+def _after_cursor(query, sort_column, order: str, key, asset_id: int):
+    if sort_column is Asset.id:
+        return query.filter(Asset.id < asset_id if order == "desc" else Asset.id > asset_id)
+    if order == "desc":
+        return query.filter(or_(sort_column < key, and_(sort_column == key, Asset.id < asset_id)))
+    return query.filter(or_(sort_column > key, and_(sort_column == key, Asset.id > asset_id)))
+
+def _list_categories(db: Session, rows, requested: Optional[List[str]]):
+    if requested:
+        return get_category_map(db, {row.category_id for row in rows}) if "category" in requested else {}
+    if FAST_JSON:
+        return get_category_map(db, {row.category_id for row in rows})
+    return asset_categories(db, rows)
+
+def _sparse_rows(rows, requested: List[str], categories) -> List[dict]:
+    items = []
+    for row in rows:
+        item = {}
+        for field in requested:
+            item[field] = categories.get(row.category_id) if field == "category" else getattr(row, field)
+        items.append(item)
+    return items
+
+def _list_response(rows, requested: Optional[List[str]], categories, paged: bool, next_cursor: Optional[str] = None):
+    if requested:
+        items = _sparse_rows(rows, requested, categories)
+    elif FAST_JSON:
+        items = build_asset_rows(rows, categories)
+    else:
+        items = build_assets(rows, categories)
+    content = {"items": items, "next_cursor": next_cursor} if paged else items
+    if FAST_JSON and not requested:
+        return FastJSONResponse(content)
+    if not paged and not requested:
+        return Response(ASSET_LIST.dump_json(items), media_type="application/json")
+    return JSONResponse(jsonable_encoder(content))
+
 @router.get("", response_model=List[AssetResponse])
+@db_handler
 def get_assets(
     status: Optional[str] = None,
     category_id: Optional[int] = None,
-    db: Session = Depends(get_db)
+    sort: Literal["id", "name", "created_at", "updated_at"] = "id",
+    order: Literal["asc", "desc"] = "asc",
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_read_db)
 ):
-    query = db.query(Asset)
+    requested = _parse_fields(fields) if fields else None
+    sort_column = SORT_COLUMNS[sort]
+
+    if requested:
+        columns = {"id", sort}
+        columns.update(field for field in requested if field != "category")
+        if "category" in requested:
+            columns.add("category_id")
+        query = db.query(*[getattr(Asset, column) for column in sorted(columns)])
+    elif FAST_JSON:
+        query = asset_column_query(db)
+    else:
+        query = asset_list_query(db)
+
     if status:
         query = query.filter(Asset.status == status)
     if category_id:
         query = query.filter(Asset.category_id == category_id)
-    return query.all()
+
+    if order == "desc":
+        query = query.order_by(sort_column.desc(), Asset.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), Asset.id.asc())
+
+    paged = limit is not None or cursor is not None
+    if not paged:
+        rows = query.all()
+        return offload(_list_response, rows, requested, _list_categories(db, rows, requested), False)
+
+    page_size = limit or DEFAULT_PAGE_SIZE
+    if cursor:
+        key, last_id = _decode_cursor(cursor, sort, order)
+        query = _after_cursor(query, sort_column, order, key, last_id)
+
+    rows = query.limit(page_size + 1).all()
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = _encode_cursor(sort, order, getattr(last, sort), last.id)
+
+    return offload(_list_response, rows, requested, _list_categories(db, rows, requested), True, next_cursor)
+
+@router.get("/search")
+@db_handler
+def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    status: Optional[str] = None,
+    category_id: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_PAGE_SIZE),
+    offset: int = Query(0, ge=0, le=MAX_SEARCH_OFFSET),
+    db: Session = Depends(get_db)
+):
+    q = q.strip()
+    if not q:
+        raise HTTPException(status_code=400, detail="Search query must not be blank")
+    criteria = []
+    if status:
+        criteria.append(Asset.status == status)
+    if category_id:
+        criteria.append(Asset.category_id == category_id)
+    assets, has_more = search_assets(db, q, limit, offset, criteria)
+    categories = asset_categories(db, assets)
+    return offload(lambda: JSONResponse(jsonable_encoder({
+        "items": build_assets(assets, categories),
+        "next_offset": offset + limit if has_more else None,
+    })))
+
+@router.get("/export")
+def export_assets(
+    format: Literal["csv", "ndjson", "parquet"] = "csv",
+    status: Optional[str] = None,
+    category_id: Optional[int] = None,
+):
+    criteria = []
+    if status:
+        criteria.append(Asset.status == status)
+    if category_id:
+        criteria.append(Asset.category_id == category_id)
+    return StreamingResponse(
+        EXPORTERS[format](criteria),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename=assets.{format}"},
+    )
+
+@router.get("/changes")
+@db_handler
+def get_asset_changes(
+    since: Optional[str] = None,
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db)
+):
+    try:
+        assets, deleted, next_token, has_more = read_changes(db, since, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except TokenExpired:
+        raise HTTPException(status_code=410, detail="Change token expired, resync from scratch")
+    categories = asset_categories(db, assets)
+    return offload(lambda: JSONResponse(jsonable_encoder({
+        "changed": build_assets(assets, categories),
+        "deleted": deleted,
+        "next_token": next_token,
+        "has_more": has_more,
+    })))
 
 @router.get("/{asset_id}", response_model=AssetResponse)
-def get_asset(asset_id: int, db: Session = Depends(get_db)):
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
-    if not asset:
-        raise HTTPException(status_code=404, detail="Asset not found")
-    return asset
+@db_handler
+def get_asset(asset_id: int, request: Request, db: Session = Depends(get_read_db)):
+    def build():
+        asset = load_asset(db, asset_id)
+        if not asset:
+            raise HTTPException(status_code=404, detail="Asset not found")
+        return AssetResponse.model_validate(serialize_asset(db, asset))
+    return cached(request, (f"asset:{asset_id}", "categories"), build)
 
 @router.post("", response_model=AssetResponse, status_code=201)
+@db_handler
 def create_asset(asset_data: AssetCreate, db: Session = Depends(get_db)):
-    asset = Asset(**asset_data.model_dump())
+    values = asset_data.model_dump()
+    asset = Asset(**values)
     db.add(asset)
-    db.commit()
-    db.refresh(asset)
+    db.flush()
+    apply_asset_changes(db, added=[asset_stats_key(asset)])
+    asset_id = asset.id
     
-    history = AssetHistory(
-        asset_id=asset.id,
-        action="CREATE",
-        details=f"Asset '{asset.name}' created"
-    )
-    db.add(history)
+    record_history(db, asset_id, "CREATE", f"Asset '{asset.name}' created", snapshot_changes(values))
     db.commit()
+    invalidate_responses("assets")
     
-    return asset
+    return serialize_asset(db, load_asset(db, asset_id))
+
+@router.post("/bulk")
+async def bulk_import_assets(
+    request: Request,
+    format: Optional[Literal["csv", "ndjson"]] = None,
+    db: Session = Depends(get_db)
+):
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = "csv" if "csv" in content_type else "ndjson"
+    stream = RequestBodyReader(request.stream())
+    records = iter_csv_records(stream) if format == "csv" else iter_ndjson_records(stream)
+    result = await run_in_threadpool(import_assets, db, records)
+    if result["created"]:
+        invalidate_responses("assets")
+    return result
+
+@router.patch("/bulk")
+@db_handler
+def bulk_update_assets(selection: AssetBulkUpdate, db: Session = Depends(get_db)):
+    updates = selection.changes.model_dump(exclude_unset=True)
+    if not updates:
+        raise HTTPException(status_code=400, detail="No changes provided")
+    try:
+        matched, updated_ids = update_selected_assets(db, selection_criteria(selection), updates)
+        db.commit()
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError as e:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=f"Update rejected by database: {e.orig}")
+    if updated_ids:
+        invalidate_responses("assets", *[f"asset:{asset_id}" for asset_id in updated_ids])
+    return {"matched": matched, "updated": len(updated_ids), "ids": updated_ids}
+
+@router.delete("/bulk")
+@db_handler
+def bulk_delete_assets(selection: AssetBulkSelection, db: Session = Depends(get_db)):
+    try:
+        deleted_ids = delete_selected_assets(db, selection_criteria(selection))
+        db.commit()
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    if deleted_ids:
+        invalidate_responses("assets", *[f"asset:{asset_id}" for asset_id in deleted_ids])
+    return {"deleted": len(deleted_ids), "ids": deleted_ids}
 
 @router.put("/{asset_id}", response_model=AssetResponse)
+@router.patch("/{asset_id}", response_model=AssetResponse)
+@db_handler
 def update_asset(asset_id: int, asset_data: AssetUpdate, db: Session = Depends(get_db)):
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    # Writers lock the asset row before asset_stats, like the bulk paths.
+    asset = db.query(Asset).filter(Asset.id == asset_id).with_for_update().first()
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
     
-    for key, value in asset_data.model_dump().items():
-        setattr(asset, key, value)
+    updates = asset_data.model_dump(exclude_unset=True)
+    changes = diff_asset(asset, updates)
+    if not changes:
+        return serialize_asset(db, asset)
     
-    db.commit()
-    db.refresh(asset)
+    before = asset_stats_key(asset)
+    for key in changes:
+        setattr(asset, key, updates[key])
+    apply_asset_changes(db, removed=[before], added=[asset_stats_key(asset)])
     
-    history = AssetHistory(
-        asset_id=asset.id,
-        action="UPDATE",
-        details=f"Asset '{asset.name}' updated"
-    )
-    db.add(history)
+    record_history(db, asset_id, "UPDATE", f"Asset '{asset.name}' updated: {', '.join(changes)}", changes)
     db.commit()
+    invalidate_responses("assets", f"asset:{asset_id}")
     
-    return asset
+    return serialize_asset(db, load_asset(db, asset_id))
 
 @router.delete("/{asset_id}", status_code=204)
+@db_handler
 def delete_asset(asset_id: int, db: Session = Depends(get_db)):
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    asset = db.query(Asset).filter(Asset.id == asset_id).with_for_update().first()
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
     
+    apply_asset_changes(db, removed=[asset_stats_key(asset)])
+    db.execute(delete(AssetHistory).where(AssetHistory.asset_id == asset_id))
+    record_tombstones(db, [asset_id])
     db.delete(asset)
     db.commit()
+    invalidate_responses("assets", f"asset:{asset_id}")
     return None
 
 @router.get("/{asset_id}/history", response_model=List[AssetHistoryResponse])
-def get_asset_history(asset_id: int, db: Session = Depends(get_db)):
+@db_handler
+def get_asset_history(
+    asset_id: int,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    if not asset:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    
+    query = db.query(AssetHistory).filter(AssetHistory.asset_id == asset_id).order_by(AssetHistory.timestamp.desc(), AssetHistory.id.desc())
+    if limit is None and cursor is None:
+        rows = query.all()
+        return offload(lambda: Response(
+            HISTORY_LIST.dump_json([AssetHistoryResponse.model_validate(row) for row in rows]),
+            media_type="application/json",
+        ))
+
+    page_size = limit or DEFAULT_PAGE_SIZE
+    if cursor:
+        key, last_id = _decode_cursor(cursor, "timestamp", "desc")
+        query = query.filter(or_(
+            AssetHistory.timestamp < key,
+            and_(AssetHistory.timestamp == key, AssetHistory.id < last_id),
+        ))
+
+    rows = query.limit(page_size + 1).all()
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = _encode_cursor("timestamp", "desc", rows[-1].timestamp, rows[-1].id)
+
+    return offload(lambda: JSONResponse(jsonable_encoder({
+        "items": [AssetHistoryResponse.model_validate(row) for row in rows],
+        "next_cursor": next_cursor,
+    })))
+
+@router.get("/{asset_id}/as-of", response_model=AssetSnapshotResponse)
+@db_handler
+def get_asset_as_of(asset_id: int, at: datetime, db: Session = Depends(get_db)):
     asset = db.query(Asset).filter(Asset.id == asset_id).first()
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
+    if at.tzinfo is not None:
+        at = at.astimezone(timezone.utc).replace(tzinfo=None)
+    if at < asset.created_at:
+        raise HTTPException(status_code=404, detail="Asset did not exist at the requested time")
     
-    history = db.query(AssetHistory).filter(AssetHistory.asset_id == asset_id).order_by(AssetHistory.timestamp.desc()).all()
-    return history
\ No newline at end of file
+    later_history = db.query(AssetHistory).filter(
+        AssetHistory.asset_id == asset_id,
+        AssetHistory.timestamp > at,
+    ).all()
+    fields, complete = reconstruct_asset(asset, later_history)
+    retained_since = history_retained_since(db.connection())
+    if retained_since is not None and at < retained_since:
+        complete = False
+    return {"asset_id": asset_id, "as_of": at, "complete": complete, "fields": fields}
\ No newline at end of file
@@ -1,17 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import List
-from models.database import get_db
+from models.database import get_db, get_read_db
 from models.category import Category
 from schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse
+from services.asset_loader import invalidate_category_map
+from services.response_cache import invalidate_responses
+from routers.db_handler import cached, db_handler
 
 router = APIRouter(prefix="/api/categories", tags=["categories"])
 
 @router.get("", response_model=List[CategoryResponse])
-def get_categories(db: Session = Depends(get_db)):
-    return db.query(Category).all()
+@db_handler
+def get_categories(request: Request, db: Session = Depends(get_read_db)):
+    return cached(request, ("categories",), lambda: [
+        CategoryResponse.model_validate(category) for category in db.query(Category).all()
+    ])
 
 @router.post("", response_model=CategoryResponse, status_code=201)
+@db_handler
 def create_category(category_data: CategoryCreate, db: Session = Depends(get_db)):
     existing = db.query(Category).filter(Category.name == category_data.name).first()
     if existing:
@@ -20,10 +27,13 @@ def create_category(category_data: CategoryCreate, db: Session = Depends(get_db)
     category = Category(**category_data.model_dump())
     db.add(category)
     db.commit()
+    invalidate_category_map()
+    invalidate_responses("categories")
     db.refresh(category)
     return category
 
 @router.put("/{category_id}", response_model=CategoryResponse)
+@db_handler
 def update_category(category_id: int, category_data: CategoryUpdate, db: Session = Depends(get_db)):
     category = db.query(Category).filter(Category.id == category_id).first()
     if not category:
@@ -33,10 +43,13 @@ def update_category(category_id: int, category_data: CategoryUpdate, db: Session
         setattr(category, key, value)
     
     db.commit()
+    invalidate_category_map()
+    invalidate_responses("categories")
     db.refresh(category)
     return category
 
 @router.delete("/{category_id}", status_code=204)
+@db_handler
 def delete_category(category_id: int, db: Session = Depends(get_db)):
     category = db.query(Category).filter(Category.id == category_id).first()
     if not category:
@@ -44,4 +57,6 @@ def delete_category(category_id: int, db: Session = Depends(get_db)):
     
     db.delete(category)
     db.commit()
+    invalidate_category_map()
+    invalidate_responses("categories")
     return None
\ No newline at end of file
@@ -1,53 +1,49 @@
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+from fastapi import APIRouter, Depends, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from models.database import get_db
-from models.asset import Asset
-from models.category import Category
-from models.asset_history import AssetHistory
+from models.database import get_read_db
+from services.dashboard_events import dashboard_broadcaster, load_recent_activities
+from services.dashboard_stats import get_summary_snapshot
+from routers.db_handler import cached, db_handler
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
-@router.get("/summary")
-def get_dashboard_summary(db: Session = Depends(get_db)):
-    total_assets = db.query(Asset).count()
-    total_value = db.query(func.sum(Asset.current_value)).scalar() or 0
-    active_assets = db.query(Asset).filter(Asset.status == "Active").count()
-    maintenance_due = db.query(Asset).filter(Asset.status == "Maintenance").count()
-    
-    category_distribution = db.query(
-        Category.name,
-        func.count(Asset.id).label("count")
-    ).join(Asset).group_by(Category.name).all()
-    
-    status_distribution = db.query(
-        Asset.status,
-        func.count(Asset.id).label("count")
-    ).group_by(Asset.status).all()
-    
-    recent_activities = db.query(AssetHistory).order_by(
-        AssetHistory.timestamp.desc()
-    ).limit(10).all()
-    
+STREAM_HEARTBEAT_SECONDS = 15
+
+def build_summary(db: Session) -> dict:
     return {
-        "total_assets": total_assets,
-        "total_value": float(total_value),
-        "active_assets": active_assets,
-        "maintenance_due": maintenance_due,
-        "category_distribution": [
-            {"name": name, "count": count} for name, count in category_distribution
-        ],
-        "status_distribution": [
-            {"status": status, "count": count} for status, count in status_distribution
-        ],
-        "recent_activities": [
-            {
-                "id": activity.id,
-                "asset_id": activity.asset_id,
-                "action": activity.action,
-                "details": activity.details,
-                "timestamp": activity.timestamp.isoformat()
-            }
-            for activity in recent_activities
-        ]
-    }
\ No newline at end of file
+        **get_summary_snapshot(db),
+        "recent_activities": load_recent_activities(db),
+    }
+
+@router.get("/summary")
+@db_handler
+def get_dashboard_summary(request: Request, db: Session = Depends(get_read_db)):
+    return cached(request, ("assets", "categories"), lambda: build_summary(db))
+
+@router.get("/stream")
+async def stream_dashboard(request: Request):
+    queue = await dashboard_broadcaster.subscribe()
+
+    async def events():
+        try:
+            while True:
+                try:
+                    name, data = await asyncio.wait_for(queue.get(), timeout=STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": ping\n\n"
+                    continue
+                yield f"event: {name}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+        finally:
+            dashboard_broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
\ No newline at end of file
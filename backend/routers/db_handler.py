@@ -0,0 +1,61 @@
+import functools
+import inspect
+from typing import Callable, Tuple
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from models.database import DB_ASYNC, get_async_db, get_async_read_db, get_db, get_read_db
+from services.response_cache import lookup_response, store_response
+
+ASYNC_DEPENDENCIES = {get_db: get_async_db, get_read_db: get_async_read_db}
+
+class Step:
+    def __init__(self, uses_db: bool, fn: Callable, args: tuple):
+        self.uses_db = uses_db
+        self.fn = fn
+        self.args = args
+
+def offload(fn: Callable, *args) -> Step:
+    return Step(False, fn, args)
+
+def with_db(fn: Callable, *args) -> Step:
+    return Step(True, fn, args)
+
+def cached(request: Request, tags: Tuple[str, ...], build: Callable[[], object]) -> Step:
+    def lookup():
+        response, key, storable = lookup_response(request, tags)
+        if response is not None:
+            return response
+        return with_db(lambda: offload(store_response, request, key, storable, build()))
+    return offload(lookup)
+
+def db_handler(handler):
+    # In async mode a sync handler runs inside AsyncSession.run_sync, which
+    # executes it on the event loop. Handlers return offload() steps for
+    # serialization and cache I/O so only the queries stay on the loop.
+    if not DB_ASYNC:
+        @functools.wraps(handler)
+        def run(*args, **kwargs):
+            result = handler(*args, **kwargs)
+            while isinstance(result, Step):
+                result = result.fn(*result.args)
+            return result
+        return run
+
+    @functools.wraps(handler)
+    async def wrapper(*args, db: AsyncSession, **kwargs):
+        result = await db.run_sync(lambda session: handler(*args, db=session, **kwargs))
+        while isinstance(result, Step):
+            step = result
+            if step.uses_db:
+                result = await db.run_sync(lambda session: step.fn(*step.args))
+            else:
+                result = await run_in_threadpool(step.fn, *step.args)
+        return result
+
+    signature = inspect.signature(handler)
+    wrapper.__signature__ = signature.replace(parameters=[
+        param.replace(annotation=AsyncSession, default=Depends(ASYNC_DEPENDENCIES[param.default.dependency])) if param.name == "db" else param
+        for param in signature.parameters.values()
+    ])
+    return wrapper
\ No newline at end of file
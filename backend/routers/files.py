@@ -1,11 +1,20 @@
 import os
+import asyncio
+import base64
 import hashlib
-from datetime import datetime, timedelta
-from uuid import uuid4
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Literal, Optional, Tuple
+from uuid import UUID, uuid4
 from urllib.parse import unquote
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, HTTPException, Request, UploadFile, File
 from fastapi.responses import Response
-from azure.storage.blob import BlobServiceClient, ContentSettings
+from starlette.concurrency import run_in_threadpool
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+from azure.storage.blob import BlobBlock, ContentSettings
+from azure.storage.blob.aio import BlobServiceClient
+from services.blob_cache import MemoryBlobCache, create_blob_cache
+from services.metrics import BLOB_CACHE_REQUESTS, BLOB_FETCHES, register_blob_cache
+from services.image_renditions import RENDITION_CONTENT_TYPE, build_renditions, rendition_path
 
 router = APIRouter(prefix="/api/files", tags=["files"])
 
@@ -14,33 +23,162 @@ AZURE_STORAGE_CONTAINER = os.getenv("AZURE_STORAGE_CONTAINER_APP_ASSET")
 AZURE_STORAGE_SAS = os.getenv("AZURE_STORAGE_SAS")
 USER_ID = os.getenv("USER_ID", "default_user")
 APP_ID = os.getenv("APP_ID", "default_app")
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(20 * 1024 * 1024)))
+UPLOAD_BLOCK_BYTES = int(os.getenv("UPLOAD_BLOCK_BYTES", str(4 * 1024 * 1024)))
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+UPLOAD_PATH = "/api/files/upload"
+RENDITION_MISS_TTL_SECONDS = int(os.getenv("RENDITION_MISS_TTL_SECONDS", "300"))
 
-_blob_cache = {}
-_cache_expiry = {}
-CACHE_TTL_SECONDS = 3600
+blob_cache = create_blob_cache()
+register_blob_cache(blob_cache)
+missing_renditions = MemoryBlobCache(1024 * 1024, RENDITION_MISS_TTL_SECONDS)
+
+DEFAULT_CACHE_CONTROL = "public, max-age=3600"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_blob_service_client = None
+_inflight_fetches: Dict[str, asyncio.Future] = {}
 
 def get_blob_service_client():
+    global _blob_service_client
     if not all([AZURE_STORAGE_ACCOUNT, AZURE_STORAGE_CONTAINER, AZURE_STORAGE_SAS]):
         raise HTTPException(status_code=503, detail="Azure Blob Storage not configured.")
-    account_url = f"https://{AZURE_STORAGE_ACCOUNT}.blob.core.windows.net"
-    return BlobServiceClient(account_url=account_url, credential=AZURE_STORAGE_SAS)
-
-def get_from_cache(cache_key: str):
-    if cache_key in _blob_cache:
-        expiry = _cache_expiry.get(cache_key)
-        if expiry and datetime.utcnow() < expiry:
-            return _blob_cache[cache_key]
-        _blob_cache.pop(cache_key, None)
-        _cache_expiry.pop(cache_key, None)
+    if _blob_service_client is None:
+        account_url = f"https://{AZURE_STORAGE_ACCOUNT}.blob.core.windows.net"
+        _blob_service_client = BlobServiceClient(account_url=account_url, credential=AZURE_STORAGE_SAS)
+    return _blob_service_client
+
+async def close_blob_service_client():
+    global _blob_service_client
+    if _blob_service_client is not None:
+        await _blob_service_client.close()
+        _blob_service_client = None
+
+async def get_from_cache(cache_key: str):
+    return await blob_cache.aget(cache_key)
+
+async def save_to_cache(cache_key: str, data: bytes, meta: dict):
+    await blob_cache.aset(cache_key, data, meta)
+
+def blob_meta(props) -> dict:
+    etag = props.etag
+    if etag and not etag.startswith('"'):
+        etag = f'"{etag}"'
+    return {
+        "content_type": props.content_settings.content_type or "application/octet-stream",
+        "etag": etag,
+        "last_modified": format_datetime(props.last_modified, usegmt=True) if props.last_modified else None,
+        "size": blob_size(props),
+    }
+
+def blob_size(props) -> int:
+    content_range = getattr(props, "content_range", None)
+    if content_range and "/" in content_range:
+        try:
+            return int(content_range.rsplit("/", 1)[1])
+        except ValueError:
+            pass
+    return props.size
+
+def is_immutable_path(blob_path: str) -> bool:
+    directory, file_name = os.path.split(blob_path)
+    if not directory.endswith("/images"):
+        return False
+    try:
+        UUID(file_name.split(".", 1)[0])
+    except ValueError:
+        return False
+    return True
+
+def is_not_modified(request: Request, meta: dict) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or any(tag.removeprefix("W/") == meta["etag"] for tag in tags)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and meta["last_modified"]:
+        try:
+            return parsedate_to_datetime(meta["last_modified"]) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+def requested_range(request: Request) -> Optional[Tuple[Optional[int], Optional[int]]]:
+    header = request.headers.get("range")
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    start, _, end = header[len("bytes="):].strip().partition("-")
+    try:
+        if not start:
+            length = int(end)
+            return (None, length) if length > 0 else None
+        start = int(start)
+        end = int(end) if end else None
+    except ValueError:
+        return None
+    if end is not None and end < start:
+        return None
+    return start, end
+
+def if_range_matches(request: Request, meta: dict) -> bool:
+    if_range = request.headers.get("if-range")
+    return not if_range or if_range in (meta["etag"], meta["last_modified"])
+
+def resolve_range(byte_range: Tuple[Optional[int], Optional[int]], size: int) -> Tuple[int, int]:
+    start, end = byte_range
+    if start is None:
+        return max(size - end, 0), size - 1
+    if start >= size:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, size - 1 if end is None else min(end, size - 1)
+
+def file_headers(blob_path: str, meta: dict, cache_status: str) -> dict:
+    headers = {
+        "Content-Disposition": f"inline; filename={os.path.basename(blob_path)}",
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if is_immutable_path(blob_path) else DEFAULT_CACHE_CONTROL,
+        "Accept-Ranges": "bytes",
+        "X-Cache": cache_status,
+    }
+    if meta["etag"]:
+        headers["ETag"] = meta["etag"]
+    if meta["last_modified"]:
+        headers["Last-Modified"] = meta["last_modified"]
+    return headers
+
+def upload_too_large():
+    return HTTPException(status_code=413, detail=f"File exceeds the {MAX_UPLOAD_BYTES} byte upload limit")
+
+def upload_length_error(content_length: Optional[str]) -> Optional[HTTPException]:
+    # The multipart body is spooled before the handler runs, so the size
+    # has to be checked from the request headers.
+    if content_length is None:
+        return HTTPException(status_code=411, detail="Uploads require a Content-Length header")
+    if not content_length.isdigit():
+        return HTTPException(status_code=400, detail="Invalid Content-Length header")
+    if int(content_length) > MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES:
+        return upload_too_large()
     return None
 
-def save_to_cache(cache_key: str, data: bytes, content_type: str):
-    _blob_cache[cache_key] = (data, content_type)
-    _cache_expiry[cache_key] = datetime.utcnow() + timedelta(seconds=CACHE_TTL_SECONDS)
+async def upload_renditions(blob_path: str, source) -> Dict[str, str]:
+    renditions = await run_in_threadpool(build_renditions, source)
+    paths = {name: rendition_path(blob_path, name) for name in renditions}
+    content_settings = ContentSettings(content_type=RENDITION_CONTENT_TYPE)
+    await asyncio.gather(*[
+        get_blob_service_client().get_blob_client(
+            container=AZURE_STORAGE_CONTAINER, blob=paths[name]
+        ).upload_blob(data, overwrite=True, content_settings=content_settings)
+        for name, data in renditions.items()
+    ])
+    return paths
 
 @router.post("/upload")
 async def upload_file(file: UploadFile = File(...)):
-    contents = await file.read()
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise upload_too_large()
     ext = os.path.splitext(file.filename)[1] if file.filename else ".jpg"
     file_name = f"{uuid4()}{ext}"
     blob_path = f"{USER_ID}/{APP_ID}/images/{file_name}"
@@ -50,48 +188,127 @@ async def upload_file(file: UploadFile = File(...)):
     )
     content_type = file.content_type or "image/jpeg"
     content_settings = ContentSettings(content_type=content_type)
-    blob_client.upload_blob(contents, overwrite=True, content_settings=content_settings)
     
-    return {"blob_path": blob_path}
+    block_list = []
+    total = 0
+    while True:
+        chunk = await file.read(UPLOAD_BLOCK_BYTES)
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > MAX_UPLOAD_BYTES:
+            raise upload_too_large()
+        block_id = base64.b64encode(f"{len(block_list):08d}".encode()).decode()
+        await blob_client.stage_block(block_id, chunk)
+        block_list.append(BlobBlock(block_id=block_id))
+    await blob_client.commit_block_list(block_list, content_settings=content_settings)
+    
+    renditions = {}
+    if content_type.startswith("image/"):
+        await file.seek(0)
+        renditions = await upload_renditions(blob_path, file.file)
+    
+    return {"blob_path": blob_path, "renditions": renditions}
+
+async def _download_blob(blob_path: str, cache_key: str):
+    blob_client = get_blob_service_client().get_blob_client(
+        container=AZURE_STORAGE_CONTAINER, blob=blob_path
+    )
+    try:
+        downloader = await blob_client.download_blob()
+    except ResourceNotFoundError:
+        raise HTTPException(status_code=404, detail=f"File not found: {blob_path}")
+    contents = await downloader.readall()
+    meta = blob_meta(downloader.properties)
+    await save_to_cache(cache_key, contents, meta)
+    return contents, meta
+
+def _finish_fetch(cache_key: str, future: asyncio.Future):
+    _inflight_fetches.pop(cache_key, None)
+    if not future.cancelled():
+        future.exception()
+
+async def fetch_blob(blob_path: str, cache_key: str):
+    future = _inflight_fetches.get(cache_key)
+    if future is None:
+        BLOB_FETCHES.labels("download").inc()
+        future = asyncio.ensure_future(_download_blob(blob_path, cache_key))
+        _inflight_fetches[cache_key] = future
+        future.add_done_callback(lambda done: _finish_fetch(cache_key, done))
+    else:
+        BLOB_FETCHES.labels("coalesced").inc()
+    return await asyncio.shield(future)
+
+async def fetch_blob_range(blob_path: str, start: int, end: Optional[int]):
+    blob_client = get_blob_service_client().get_blob_client(
+        container=AZURE_STORAGE_CONTAINER, blob=blob_path
+    )
+    length = end - start + 1 if end is not None else None
+    try:
+        downloader = await blob_client.download_blob(offset=start, length=length)
+    except ResourceNotFoundError:
+        raise HTTPException(status_code=404, detail=f"File not found: {blob_path}")
+    except HttpResponseError as e:
+        if e.status_code == 416:
+            return None
+        raise
+    return await downloader.readall(), blob_meta(downloader.properties)
+
+def partial_response(part: bytes, start: int, meta: dict, headers: dict) -> Response:
+    headers["Content-Range"] = f"bytes {start}-{start + len(part) - 1}/{meta['size']}"
+    return Response(content=part, status_code=206, media_type=meta["content_type"], headers=headers)
+
+def not_modified_response(headers: dict) -> Response:
+    headers.pop("Content-Disposition")
+    return Response(status_code=304, headers=headers)
+
+async def fetch_rendition(blob_path: str, size: str, cache_key: str):
+    served_path = rendition_path(blob_path, size)
+    if missing_renditions.get(cache_key) is None:
+        try:
+            return await fetch_blob(served_path, cache_key), served_path
+        except HTTPException as e:
+            if e.status_code != 404:
+                raise
+            missing_renditions.set(cache_key, served_path.encode(), {})
+    original_key = hashlib.md5(blob_path.encode()).hexdigest()
+    cached = await get_from_cache(original_key) or await fetch_blob(blob_path, original_key)
+    return cached, blob_path
 
 @router.get("/{blob_path:path}")
-async def get_file(blob_path: str):
+async def get_file(blob_path: str, request: Request, size: Literal["thumb", "medium", "full"] = "full"):
     decoded_path = unquote(blob_path)
-    cache_key = hashlib.md5(decoded_path.encode()).hexdigest()
+    served_path = decoded_path if size == "full" else rendition_path(decoded_path, size)
+    cache_key = hashlib.md5(served_path.encode()).hexdigest()
+    byte_range = requested_range(request)
     
-    cached = get_from_cache(cache_key)
-    if cached:
-        contents, content_type = cached
-        return Response(
-            content=contents,
-            media_type=content_type,
-            headers={
-                "Content-Disposition": f"inline; filename={os.path.basename(decoded_path)}",
-                "Cache-Control": "public, max-age=3600",
-                "X-Cache": "HIT",
-            },
-        )
+    cached = await get_from_cache(cache_key)
+    cache_status = "HIT" if cached else "MISS"
+    BLOB_CACHE_REQUESTS.labels(cache_status.lower()).inc()
     
-    blob_client = get_blob_service_client().get_blob_client(
-        container=AZURE_STORAGE_CONTAINER, blob=decoded_path
-    )
+    if not cached and size != "full":
+        cached, served_path = await fetch_rendition(decoded_path, size, cache_key)
+    
+    if not cached and byte_range and byte_range[0] is not None:
+        partial = await fetch_blob_range(decoded_path, *byte_range)
+        if partial:
+            part, meta = partial
+            headers = file_headers(served_path, meta, cache_status)
+            if is_not_modified(request, meta):
+                return not_modified_response(headers)
+            if if_range_matches(request, meta):
+                return partial_response(part, byte_range[0], meta, headers)
     
-    if not blob_client.exists():
-        raise HTTPException(status_code=404, detail=f"File not found: {decoded_path}")
+    if not cached:
+        cached = await fetch_blob(decoded_path, cache_key)
+    contents, meta = cached
     
-    blob_data = blob_client.download_blob()
-    contents = blob_data.readall()
-    props = blob_client.get_blob_properties()
-    content_type = props.content_settings.content_type or "application/octet-stream"
+    headers = file_headers(served_path, meta, cache_status)
+    if is_not_modified(request, meta):
+        return not_modified_response(headers)
     
-    save_to_cache(cache_key, contents, content_type)
+    if byte_range and if_range_matches(request, meta):
+        start, end = resolve_range(byte_range, meta["size"])
+        return partial_response(contents[start:end + 1], start, meta, headers)
     
-    return Response(
-        content=contents,
-        media_type=content_type,
-        headers={
-            "Content-Disposition": f"inline; filename={os.path.basename(decoded_path)}",
-            "Cache-Control": "public, max-age=3600",
-            "X-Cache": "MISS",
-        },
-    )
\ No newline at end of file
+    return Response(content=contents, media_type=meta["content_type"], headers=headers)
\ No newline at end of file
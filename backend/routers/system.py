@@ -0,0 +1,8 @@
+from fastapi import APIRouter
+from services.pool_metrics import pool_snapshot
+
+router = APIRouter(prefix="/api/system", tags=["system"])
+
+@router.get("/pool")
+def get_pool_metrics():
+    return pool_snapshot()
\ No newline at end of file
@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 from datetime import date, datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 class CategoryBase(BaseModel):
     name: str
@@ -29,8 +29,43 @@ class AssetBase(BaseModel):
 class AssetCreate(AssetBase):
     pass
 
-class AssetUpdate(AssetBase):
-    pass
+class AssetUpdate(BaseModel):
+    name: Optional[str] = None
+    description: Optional[str] = None
+    serial_number: Optional[str] = None
+    purchase_date: Optional[date] = None
+    purchase_price: Optional[float] = None
+    current_value: Optional[float] = None
+    status: Optional[str] = None
+    location: Optional[str] = None
+    category_id: Optional[int] = None
+    assigned_to: Optional[str] = None
+    image_path: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_required_fields(self):
+        for field in ("name", "status", "category_id"):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        return self
+
+class AssetBulkFilter(BaseModel):
+    status: Optional[str] = None
+    category_id: Optional[int] = None
+    location: Optional[str] = None
+
+class AssetBulkSelection(BaseModel):
+    ids: Optional[List[int]] = None
+    filter: Optional[AssetBulkFilter] = None
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if not self.ids and not (self.filter and self.filter.model_dump(exclude_none=True)):
+            raise ValueError("Provide ids or at least one filter field")
+        return self
+
+class AssetBulkUpdate(AssetBulkSelection):
+    changes: AssetUpdate
 
 class AssetResponse(AssetBase):
     id: int
@@ -46,7 +81,14 @@ class AssetHistoryResponse(BaseModel):
     asset_id: int
     action: str
     details: Optional[str] = None
+    changes: Optional[Dict[str, List[Any]]] = None
     timestamp: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class AssetSnapshotResponse(BaseModel):
+    asset_id: int
+    as_of: datetime
+    complete: bool
+    fields: Dict[str, Any]
\ No newline at end of file
@@ -0,0 +1,80 @@
+import os
+from datetime import datetime
+from typing import List, Tuple
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+from models.asset import Asset
+from models.asset_history import AssetHistory
+from schemas.asset import AssetBulkSelection
+from services.change_feed import record_tombstones
+from services.dashboard_stats import apply_asset_changes
+from services.history_diff import diff_asset
+
+MAX_BULK_ASSETS = int(os.getenv("MAX_BULK_ASSETS", "10000"))
+
+STATS_FIELDS = ("status", "category_id", "current_value")
+
+def selection_criteria(selection: AssetBulkSelection) -> list:
+    criteria = []
+    if selection.ids:
+        criteria.append(Asset.id.in_(selection.ids))
+    if selection.filter:
+        for key, value in selection.filter.model_dump(exclude_none=True).items():
+            criteria.append(getattr(Asset, key) == value)
+    return criteria
+
+def _lock_selected(db: Session, criteria: list, fields) -> list:
+    columns = [Asset.id] + [getattr(Asset, field) for field in fields]
+    rows = db.execute(
+        select(*columns).where(*criteria).order_by(Asset.id).limit(MAX_BULK_ASSETS + 1).with_for_update()
+    ).all()
+    if len(rows) > MAX_BULK_ASSETS:
+        raise ValueError(f"Selection matches more than {MAX_BULK_ASSETS} assets")
+    return rows
+
+def _stats_key(values) -> tuple:
+    return tuple(values[field] for field in STATS_FIELDS)
+
+def update_selected_assets(db: Session, criteria: list, updates: dict) -> Tuple[int, List[int]]:
+    fields = sorted(set(updates) | set(STATS_FIELDS) | {"name"})
+    rows = _lock_selected(db, criteria, fields)
+    now = datetime.utcnow()
+    updated_ids, history, removed, added = [], [], [], []
+    for row in rows:
+        changes = diff_asset(row, updates)
+        if not changes:
+            continue
+        before = row._mapping
+        after = {**before, **updates}
+        updated_ids.append(row.id)
+        removed.append(_stats_key(before))
+        added.append(_stats_key(after))
+        history.append({
+            "asset_id": row.id,
+            "action": "UPDATE",
+            "details": f"Asset '{after['name']}' updated: {', '.join(changes)}",
+            "changes": changes,
+            "timestamp": now,
+        })
+
+    if updated_ids:
+        db.execute(
+            update(Asset).where(Asset.id.in_(updated_ids)).values(**updates, updated_at=now),
+            execution_options={"synchronize_session": False},
+        )
+        db.execute(insert(AssetHistory).values(history))
+        apply_asset_changes(db, removed=removed, added=added)
+    return len(rows), updated_ids
+
+def delete_selected_assets(db: Session, criteria: list) -> List[int]:
+    rows = _lock_selected(db, criteria, STATS_FIELDS)
+    deleted_ids = [row.id for row in rows]
+    if deleted_ids:
+        db.execute(delete(AssetHistory).where(AssetHistory.asset_id.in_(deleted_ids)))
+        db.execute(
+            delete(Asset).where(Asset.id.in_(deleted_ids)),
+            execution_options={"synchronize_session": False},
+        )
+        record_tombstones(db, deleted_ids)
+        apply_asset_changes(db, removed=[_stats_key(row._mapping) for row in rows])
+    return deleted_ids
\ No newline at end of file
@@ -0,0 +1,130 @@
+import csv
+import io
+import json
+import os
+from datetime import date, datetime
+from typing import Iterator, List
+from sqlalchemy import select
+from models.asset import Asset
+from models.database import SessionLocal
+from services.asset_loader import get_category_map
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+EXPORT_COLUMNS = [
+    "id", "name", "description", "serial_number", "purchase_date", "purchase_price",
+    "current_value", "status", "location", "category_id", "assigned_to", "image_path",
+    "created_at", "updated_at",
+]
+EXPORT_FIELDS = EXPORT_COLUMNS + ["category"]
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+def _iter_batches(criteria) -> Iterator[List[tuple]]:
+    db = SessionLocal()
+    try:
+        categories = {category_id: category.name for category_id, category in get_category_map(db).items()}
+        stmt = (
+            select(*[getattr(Asset, column) for column in EXPORT_COLUMNS])
+            .where(*criteria)
+            .order_by(Asset.id)
+            .execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+        )
+        category_index = EXPORT_COLUMNS.index("category_id")
+        for partition in db.execute(stmt).partitions():
+            yield [tuple(row) + (categories.get(row[category_index]),) for row in partition]
+    finally:
+        db.close()
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+def export_csv(criteria) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    yield buffer.getvalue().encode()
+    for batch in _iter_batches(criteria):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            [value.isoformat() if isinstance(value, (date, datetime)) else value for value in row]
+            for row in batch
+        )
+        yield buffer.getvalue().encode()
+
+def export_ndjson(criteria) -> Iterator[bytes]:
+    for batch in _iter_batches(criteria):
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_FIELDS, row)), default=_json_default) + "\n"
+            for row in batch
+        ).encode()
+
+class _ChunkSink(io.RawIOBase):
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+def export_parquet(criteria) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("id", pa.int64()),
+        ("name", pa.string()),
+        ("description", pa.string()),
+        ("serial_number", pa.string()),
+        ("purchase_date", pa.date32()),
+        ("purchase_price", pa.float64()),
+        ("current_value", pa.float64()),
+        ("status", pa.string()),
+        ("location", pa.string()),
+        ("category_id", pa.int64()),
+        ("assigned_to", pa.string()),
+        ("image_path", pa.string()),
+        ("created_at", pa.timestamp("us")),
+        ("updated_at", pa.timestamp("us")),
+        ("category", pa.string()),
+    ])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="snappy")
+    try:
+        for batch in _iter_batches(criteria):
+            columns = list(zip(*batch))
+            writer.write_batch(pa.RecordBatch.from_arrays(
+                [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+                schema=schema,
+            ))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+EXPORTERS = {
+    "csv": export_csv,
+    "ndjson": export_ndjson,
+    "parquet": export_parquet,
+}
\ No newline at end of file
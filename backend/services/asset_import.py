@@ -0,0 +1,183 @@
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import AsyncIterator, Iterator, List, Tuple
+import anyio.from_thread
+from pydantic import ValidationError
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from models.asset import Asset
+from models.asset_history import AssetHistory
+from schemas.asset import AssetCreate
+from services.asset_loader import get_category_map
+from services.dashboard_stats import apply_asset_changes
+from services.history_diff import snapshot_changes
+
+BULK_IMPORT_BATCH_SIZE = int(os.getenv("BULK_IMPORT_BATCH_SIZE", "1000"))
+MAX_REPORTED_ERRORS = 1000
+
+class RequestBodyReader(io.RawIOBase):
+    def __init__(self, body: AsyncIterator[bytes]):
+        self._chunks = self._iter_chunks(body.__aiter__())
+        self._buffer = b""
+
+    @staticmethod
+    def _iter_chunks(body) -> Iterator[bytes]:
+        while True:
+            try:
+                yield anyio.from_thread.run(body.__anext__)
+            except StopAsyncIteration:
+                return
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+def iter_csv_records(stream) -> Iterator[Tuple[int, object]]:
+    text = io.TextIOWrapper(io.BufferedReader(stream), encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text)
+    row = 0
+    while True:
+        row += 1
+        try:
+            record = next(reader)
+        except StopIteration:
+            return
+        except (csv.Error, UnicodeDecodeError) as e:
+            yield row, e
+            return
+        yield row, {key: (value if value != "" else None) for key, value in record.items() if key is not None}
+
+def iter_ndjson_records(stream) -> Iterator[Tuple[int, object]]:
+    row = 0
+    for line in io.BufferedReader(stream):
+        line = line.strip()
+        if not line:
+            continue
+        row += 1
+        try:
+            yield row, json.loads(line)
+        except ValueError as e:
+            yield row, e
+
+def _validate(record) -> AssetCreate:
+    if isinstance(record, Exception):
+        raise ValueError(str(record))
+    if not isinstance(record, dict):
+        raise ValueError("Row must be an object")
+    return AssetCreate.model_validate(record)
+
+def _error_messages(error: Exception) -> List[str]:
+    if isinstance(error, ValidationError):
+        return [
+            f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" if item["loc"] else item["msg"]
+            for item in error.errors()
+        ]
+    return [str(error)]
+
+_IDENTITY_FIELDS = ("name", "serial_number", "category_id", "status")
+
+def _insert_assets(db: Session, values: List[dict]) -> List[int]:
+    # Interleaved auto-increment (MySQL's default) can leave gaps in a
+    # multi-row INSERT, so read the ids back in insertion order, skipping
+    # rows from concurrent writers.
+    floor = db.execute(select(func.coalesce(func.max(Asset.id), 0))).scalar()
+    db.execute(insert(Asset).values(values))
+    rows = db.execute(
+        select(Asset.id, *[getattr(Asset, field) for field in _IDENTITY_FIELDS])
+        .where(Asset.id > floor, Asset.created_at == values[0]["created_at"])
+        .order_by(Asset.id)
+    ).all()
+    ids = []
+    for row in rows:
+        expected = values[len(ids)]
+        if tuple(row[1:]) == tuple(expected[field] for field in _IDENTITY_FIELDS):
+            ids.append(row.id)
+            if len(ids) == len(values):
+                return ids
+    raise SQLAlchemyError("Could not read back the generated asset ids")
+
+def _insert_batch(db: Session, batch: List[Tuple[int, AssetCreate]], report: dict):
+    valid = []
+    category_ids = {item.category_id for _, item in batch}
+    categories = get_category_map(db, category_ids)
+    serials = [item.serial_number for _, item in batch if item.serial_number]
+    taken = set()
+    if serials:
+        taken = {
+            serial for (serial,) in
+            db.query(Asset.serial_number).filter(Asset.serial_number.in_(serials))
+        }
+
+    for row, item in batch:
+        if item.category_id not in categories:
+            _record_error(report, row, [f"category_id: Unknown category {item.category_id}"])
+        elif item.serial_number and item.serial_number in taken:
+            _record_error(report, row, [f"serial_number: '{item.serial_number}' already exists"])
+        else:
+            if item.serial_number:
+                taken.add(item.serial_number)
+            valid.append((row, item))
+
+    if not valid:
+        return
+
+    now = datetime.utcnow().replace(microsecond=0)
+    values = [dict(item.model_dump(), created_at=now, updated_at=now) for _, item in valid]
+    try:
+        asset_ids = _insert_assets(db, values)
+        db.execute(insert(AssetHistory).values([
+            {
+                "asset_id": asset_ids[offset],
+                "action": "CREATE",
+                "details": f"Asset '{item.name}' created",
+                "changes": snapshot_changes(values[offset]),
+                "timestamp": now,
+            }
+            for offset, (_, item) in enumerate(valid)
+        ]))
+        apply_asset_changes(db, added=[
+            (item.status, item.category_id, item.current_value) for _, item in valid
+        ])
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        message = str(getattr(e, "orig", None) or e)
+        for row, _ in valid:
+            _record_error(report, row, [f"Batch rejected by database: {message}"])
+        return
+    report["created"] += len(valid)
+
+def _record_error(report: dict, row: int, messages: List[str]):
+    report["failed"] += 1
+    if len(report["errors"]) < MAX_REPORTED_ERRORS:
+        report["errors"].append({"row": row, "errors": messages})
+
+def import_assets(db: Session, records: Iterator[Tuple[int, object]], batch_size: int = BULK_IMPORT_BATCH_SIZE) -> dict:
+    report = {"created": 0, "failed": 0, "errors": []}
+    batch = []
+    for row, record in records:
+        try:
+            batch.append((row, _validate(record)))
+        except (ValidationError, ValueError) as e:
+            _record_error(report, row, _error_messages(e))
+        if len(batch) >= batch_size:
+            _insert_batch(db, batch, report)
+            batch = []
+    if batch:
+        _insert_batch(db, batch, report)
+    report["errors"].sort(key=lambda error: error["row"])
+    return report
\ No newline at end of file
@@ -0,0 +1,86 @@
+import os
+import time
+from typing import Dict, Iterable, List
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from models.asset import Asset
+from models.category import Category
+from schemas.asset import AssetResponse, CategoryResponse
+
+ASSET_LOADER_STRATEGY = os.getenv("ASSET_LOADER_STRATEGY", "map").lower()
+CATEGORY_MAP_TTL_SECONDS = int(os.getenv("CATEGORY_MAP_TTL_SECONDS", "60"))
+
+_ASSET_COLUMNS = Asset.__table__.columns.keys()
+
+_category_map: Dict[int, CategoryResponse] = {}
+_category_map_expiry = 0.0
+
+def invalidate_category_map():
+    global _category_map_expiry
+    _category_map_expiry = 0.0
+
+def get_category_map(db: Session, required: Iterable[int] = ()) -> Dict[int, CategoryResponse]:
+    global _category_map, _category_map_expiry
+    stale = time.monotonic() >= _category_map_expiry
+    if not stale and any(category_id not in _category_map for category_id in required):
+        stale = True
+    if stale:
+        _category_map = {
+            category.id: CategoryResponse.model_validate(category)
+            for category in db.query(Category).all()
+        }
+        _category_map_expiry = time.monotonic() + CATEGORY_MAP_TTL_SECONDS
+    return _category_map
+
+def asset_load_options():
+    if ASSET_LOADER_STRATEGY == "joined":
+        return [joinedload(Asset.category)]
+    if ASSET_LOADER_STRATEGY == "selectin":
+        return [selectinload(Asset.category)]
+    return [raiseload(Asset.category)]
+
+def query_assets(db: Session, *criteria):
+    query = db.query(Asset).options(*asset_load_options())
+    if criteria:
+        query = query.filter(*criteria)
+    return query
+
+def load_asset(db: Session, asset_id: int):
+    return query_assets(db, Asset.id == asset_id).first()
+
+def asset_categories(db: Session, assets) -> Dict[int, CategoryResponse]:
+    if ASSET_LOADER_STRATEGY in ("joined", "selectin"):
+        return {}
+    return get_category_map(db, {asset.category_id for asset in assets})
+
+def build_assets(assets, categories: Dict[int, CategoryResponse]) -> List[AssetResponse]:
+    if ASSET_LOADER_STRATEGY in ("joined", "selectin"):
+        return [AssetResponse.model_validate(asset) for asset in assets]
+    items = []
+    for asset in assets:
+        data = {key: getattr(asset, key) for key in _ASSET_COLUMNS}
+        data["category"] = categories.get(asset.category_id)
+        items.append(AssetResponse.model_validate(data))
+    return items
+
+def serialize_assets(db: Session, assets: List[Asset]) -> List[AssetResponse]:
+    return build_assets(assets, asset_categories(db, assets))
+
+def asset_column_query(db: Session):
+    return db.query(*[getattr(Asset, key) for key in _ASSET_COLUMNS])
+
+def asset_list_query(db: Session):
+    # The map strategy fills in category from get_category_map, so plain
+    # column rows carry everything and skip building an Asset per row.
+    if ASSET_LOADER_STRATEGY in ("joined", "selectin"):
+        return db.query(Asset).options(*asset_load_options())
+    return asset_column_query(db)
+
+def build_asset_rows(rows, categories: Dict[int, CategoryResponse]) -> List[dict]:
+    category_dicts = {category_id: category.model_dump() for category_id, category in categories.items()}
+    return [dict(zip(_ASSET_COLUMNS, row), category=category_dicts.get(row.category_id)) for row in rows]
+
+def serialize_asset_rows(db: Session, rows) -> List[dict]:
+    return build_asset_rows(rows, get_category_map(db, {row.category_id for row in rows}))
+
+def serialize_asset(db: Session, asset: Asset) -> AssetResponse:
+    return serialize_assets(db, [asset])[0]
\ No newline at end of file
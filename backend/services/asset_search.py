@@ -0,0 +1,60 @@
+import re
+from typing import List, Optional, Tuple
+from sqlalchemy import desc
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+from models.asset import Asset
+from services.asset_loader import query_assets
+
+MIN_TOKEN_LENGTH = 3
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+def boolean_query(q: str) -> str:
+    terms = []
+    for token in _TOKEN_PATTERN.findall(q):
+        terms.append(f"+{token}*" if len(token) >= MIN_TOKEN_LENGTH else f"{token}*")
+    return " ".join(terms)
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def search_assets(
+    db: Session,
+    q: str,
+    limit: int,
+    offset: int,
+    criteria: Optional[list] = None,
+) -> Tuple[List[Asset], bool]:
+    criteria = criteria or []
+    window = offset + limit + 1
+    ranked = {}
+
+    serial_matches = db.query(Asset.id, Asset.serial_number).filter(
+        Asset.serial_number.like(f"{_escape_like(q)}%", escape="\\"),
+        *criteria,
+    ).order_by(Asset.serial_number).limit(window)
+    for asset_id, serial_number in serial_matches:
+        ranked[asset_id] = (2 if serial_number == q else 1, 0.0)
+
+    terms = boolean_query(q)
+    if terms:
+        relevance = match(
+            Asset.name, Asset.description, Asset.location, Asset.assigned_to,
+            against=terms,
+        ).in_boolean_mode()
+        text_matches = db.query(Asset.id, relevance.label("score")).filter(
+            relevance,
+            *criteria,
+        ).order_by(desc("score"), Asset.id).limit(window)
+        for asset_id, score in text_matches:
+            ranked.setdefault(asset_id, (0, float(score)))
+
+    ordered = sorted(ranked, key=lambda asset_id: (-ranked[asset_id][0], -ranked[asset_id][1], asset_id))
+    page_ids = ordered[offset:offset + limit]
+    has_more = len(ordered) > offset + limit
+    if not page_ids:
+        return [], has_more
+
+    assets = {asset.id: asset for asset in query_assets(db, Asset.id.in_(page_ids))}
+    return [assets[asset_id] for asset_id in page_ids if asset_id in assets], has_more
\ No newline at end of file
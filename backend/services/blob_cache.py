@@ -0,0 +1,250 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import anyio.to_thread
+
+BLOB_CACHE_TTL_SECONDS = int(os.getenv("BLOB_CACHE_TTL_SECONDS", "3600"))
+BLOB_CACHE_MAX_BYTES = int(os.getenv("BLOB_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+BLOB_CACHE_DIR = os.getenv("BLOB_CACHE_DIR", "")
+BLOB_CACHE_DISK_MAX_BYTES = int(os.getenv("BLOB_CACHE_DISK_MAX_BYTES", str(1024 * 1024 * 1024)))
+BLOB_CACHE_SWEEP_SECONDS = int(os.getenv("BLOB_CACHE_SWEEP_SECONDS", "60"))
+
+CachedBlob = Tuple[bytes, dict]
+
+class MemoryBlobCache:
+    name = "memory"
+
+    def __init__(self, max_bytes: int, ttl_seconds: int):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.size_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        self._entries: "OrderedDict[str, Tuple[bytes, dict, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedBlob]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            data, meta, expires_at = entry
+            if time.monotonic() >= expires_at:
+                self._remove(key)
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return data, meta
+
+    def set(self, key: str, data: bytes, meta: dict):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (data, meta, time.monotonic() + self.ttl_seconds)
+            self.size_bytes += len(data)
+            while self.size_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats["evictions"] += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._remove(key)
+
+    def sweep(self):
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (_, _, expires_at) in self._entries.items() if now >= expires_at]
+            for key in expired:
+                self._remove(key)
+            self.stats["expirations"] += len(expired)
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= len(entry[0])
+
+class DiskBlobCache:
+    name = "disk"
+
+    def __init__(self, directory: str, max_bytes: int, ttl_seconds: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        self._keys_dir = os.path.join(directory, "keys")
+        self._blobs_dir = os.path.join(directory, "blobs")
+        os.makedirs(self._keys_dir, exist_ok=True)
+        os.makedirs(self._blobs_dir, exist_ok=True)
+
+    def _key_path(self, key: str) -> str:
+        return os.path.join(self._keys_dir, f"{key}.json")
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self._blobs_dir, digest[:2], digest)
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, key: str) -> Optional[CachedBlob]:
+        try:
+            with open(self._key_path(key), "rb") as f:
+                entry = json.load(f)
+            if time.time() >= entry["expires_at"]:
+                self._unlink(self._key_path(key))
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return None
+            blob_path = self._blob_path(entry["digest"])
+            with open(blob_path, "rb") as f:
+                data = f.read()
+            os.utime(blob_path)
+        except (OSError, ValueError, KeyError):
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return data, entry["meta"]
+
+    def set(self, key: str, data: bytes, meta: dict):
+        if len(data) > self.max_bytes:
+            return
+        digest = hashlib.sha256(data).hexdigest()
+        try:
+            blob_path = self._blob_path(digest)
+            if not os.path.exists(blob_path):
+                self._write_atomic(blob_path, data)
+            entry = {"digest": digest, "meta": meta, "expires_at": time.time() + self.ttl_seconds}
+            self._write_atomic(self._key_path(key), json.dumps(entry).encode())
+        except OSError as e:
+            print(f"Warning: Could not write blob cache entry: {e}")
+
+    def delete(self, key: str):
+        self._unlink(self._key_path(key))
+
+    def sweep(self):
+        now = time.time()
+        live = set()
+        for name in os.listdir(self._keys_dir):
+            path = os.path.join(self._keys_dir, name)
+            try:
+                with open(path, "rb") as f:
+                    entry = json.load(f)
+                if now < entry["expires_at"]:
+                    live.add(entry["digest"])
+                    continue
+                self.stats["expirations"] += 1
+            except (OSError, ValueError, KeyError):
+                pass
+            self._unlink(path)
+
+        blobs = []
+        for root, _, files in os.walk(self._blobs_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                if name.endswith(".tmp"):
+                    continue
+                if name not in live:
+                    self._unlink(path)
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                blobs.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in blobs)
+        for _, size, path in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            self._unlink(path)
+            total -= size
+            self.stats["evictions"] += 1
+
+    @staticmethod
+    def _unlink(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+class TieredBlobCache:
+    def __init__(self, tiers, sweep_interval: int = BLOB_CACHE_SWEEP_SECONDS):
+        self.tiers = tiers
+        self.sweep_interval = sweep_interval
+        self._next_sweep = time.monotonic() + sweep_interval
+        self._sweep_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedBlob]:
+        self._maybe_sweep()
+        return self._get_from(0, key)
+
+    def set(self, key: str, data: bytes, meta: dict):
+        self._set_from(0, key, data, meta)
+
+    async def aget(self, key: str) -> Optional[CachedBlob]:
+        self._maybe_sweep()
+        cached = self.tiers[0].get(key)
+        if cached is not None or len(self.tiers) == 1:
+            return cached
+        return await anyio.to_thread.run_sync(self._get_from, 1, key)
+
+    async def aset(self, key: str, data: bytes, meta: dict):
+        self.tiers[0].set(key, data, meta)
+        if len(self.tiers) > 1:
+            await anyio.to_thread.run_sync(self._set_from, 1, key, data, meta)
+
+    def _get_from(self, start: int, key: str) -> Optional[CachedBlob]:
+        for index in range(start, len(self.tiers)):
+            cached = self.tiers[index].get(key)
+            if cached is not None:
+                for upper in self.tiers[:index]:
+                    upper.set(key, *cached)
+                return cached
+        return None
+
+    def _set_from(self, start: int, key: str, data: bytes, meta: dict):
+        for tier in self.tiers[start:]:
+            tier.set(key, data, meta)
+
+    def delete(self, key: str):
+        for tier in self.tiers:
+            tier.delete(key)
+
+    def sweep(self):
+        for tier in self.tiers:
+            tier.sweep()
+
+    def stats(self) -> Dict[str, dict]:
+        return {tier.name: dict(tier.stats) for tier in self.tiers}
+
+    def _maybe_sweep(self):
+        if time.monotonic() < self._next_sweep or not self._sweep_lock.acquire(blocking=False):
+            return
+        self._next_sweep = time.monotonic() + self.sweep_interval
+        threading.Thread(target=self._sweep_in_background, name="blob-cache-sweeper", daemon=True).start()
+
+    def _sweep_in_background(self):
+        try:
+            self.sweep()
+        except Exception as e:
+            print(f"Warning: Blob cache sweep failed: {e}")
+        finally:
+            self._sweep_lock.release()
+
+def create_blob_cache() -> TieredBlobCache:
+    tiers = [MemoryBlobCache(BLOB_CACHE_MAX_BYTES, BLOB_CACHE_TTL_SECONDS)]
+    if BLOB_CACHE_DIR:
+        tiers.append(DiskBlobCache(BLOB_CACHE_DIR, BLOB_CACHE_DISK_MAX_BYTES, BLOB_CACHE_TTL_SECONDS))
+    return TieredBlobCache(tiers)
\ No newline at end of file
@@ -0,0 +1,85 @@
+import base64
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import and_, delete, insert, or_
+from sqlalchemy.orm import Session
+from models.asset import Asset
+from models.asset_tombstone import AssetTombstone
+from services.asset_loader import query_assets
+
+CHANGE_FEED_SETTLE_SECONDS = int(os.getenv("CHANGE_FEED_SETTLE_SECONDS", "5"))
+TOMBSTONE_RETENTION_DAYS = int(os.getenv("TOMBSTONE_RETENTION_DAYS", "30"))
+
+EPOCH = datetime(1970, 1, 1)
+
+Position = Tuple[datetime, int]
+
+class TokenExpired(Exception):
+    pass
+
+def encode_token(assets: Position, deleted: Position) -> str:
+    payload = json.dumps(
+        [assets[0].isoformat(), assets[1], deleted[0].isoformat(), deleted[1]],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_token(token: str) -> Tuple[Position, Position]:
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        assets_at, asset_id, deleted_at, deleted_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (datetime.fromisoformat(assets_at), int(asset_id)), (datetime.fromisoformat(deleted_at), int(deleted_id))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid change token")
+
+def record_tombstones(db: Session, asset_ids: Iterable[int]):
+    now = datetime.utcnow()
+    rows = [{"asset_id": asset_id, "deleted_at": now} for asset_id in asset_ids]
+    if rows:
+        db.execute(insert(AssetTombstone).values(rows))
+
+def prune_tombstones(db: Session, retention_days: int = TOMBSTONE_RETENTION_DAYS) -> int:
+    if retention_days <= 0:
+        return 0
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    return db.execute(delete(AssetTombstone).where(AssetTombstone.deleted_at < cutoff)).rowcount
+
+def _after(column, id_column, position: Position):
+    at, last_id = position
+    return or_(column > at, and_(column == at, id_column > last_id))
+
+def _next_position(rows: list, position: Position, key, horizon: datetime, has_more: bool) -> Position:
+    # Transactions still open may commit rows stamped before the settle
+    # horizon, so a finished read never leaves the token past it.
+    last = key(rows[-1]) if rows else position
+    if has_more:
+        return last
+    return min(last, (horizon, 0))
+
+def read_changes(db: Session, token: Optional[str], limit: int) -> Tuple[List[Asset], List[int], str, bool]:
+    now = datetime.utcnow()
+    horizon = now - timedelta(seconds=CHANGE_FEED_SETTLE_SECONDS)
+    if token:
+        assets_position, deleted_position = decode_token(token)
+        if TOMBSTONE_RETENTION_DAYS > 0 and deleted_position[0] < now - timedelta(days=TOMBSTONE_RETENTION_DAYS):
+            raise TokenExpired()
+    else:
+        assets_position, deleted_position = (EPOCH, 0), (horizon, 0)
+
+    assets = query_assets(db, _after(Asset.updated_at, Asset.id, assets_position)).order_by(
+        Asset.updated_at, Asset.id
+    ).limit(limit + 1).all()
+    tombstones = db.query(AssetTombstone).filter(
+        _after(AssetTombstone.deleted_at, AssetTombstone.asset_id, deleted_position)
+    ).order_by(AssetTombstone.deleted_at, AssetTombstone.asset_id).limit(limit + 1).all()
+
+    assets_more = len(assets) > limit
+    deleted_more = len(tombstones) > limit
+    assets, tombstones = assets[:limit], tombstones[:limit]
+    next_token = encode_token(
+        _next_position(assets, assets_position, lambda row: (row.updated_at, row.id), horizon, assets_more),
+        _next_position(tombstones, deleted_position, lambda row: (row.deleted_at, row.asset_id), horizon, deleted_more),
+    )
+    return assets, [row.asset_id for row in tombstones], next_token, assets_more or deleted_more
\ No newline at end of file
@@ -0,0 +1,132 @@
+import asyncio
+import contextvars
+import os
+from typing import List, Optional, Set, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from models.asset_history import AssetHistory
+from models.database import SessionLocal
+from services.dashboard_stats import get_summary_snapshot
+
+DASHBOARD_STREAM_DEBOUNCE_MS = int(os.getenv("DASHBOARD_STREAM_DEBOUNCE_MS", "250"))
+DASHBOARD_STREAM_REFRESH_SECONDS = int(os.getenv("DASHBOARD_STREAM_REFRESH_SECONDS", "15"))
+DASHBOARD_STREAM_QUEUE_SIZE = int(os.getenv("DASHBOARD_STREAM_QUEUE_SIZE", "32"))
+RECENT_ACTIVITY_LIMIT = 10
+
+DashboardEvent = Tuple[str, object]
+
+def serialize_activity(activity: AssetHistory) -> dict:
+    return {
+        "id": activity.id,
+        "asset_id": activity.asset_id,
+        "action": activity.action,
+        "details": activity.details,
+        "timestamp": activity.timestamp.isoformat(),
+    }
+
+def load_recent_activities(db: Session, after_id: int = 0) -> List[dict]:
+    query = db.query(AssetHistory)
+    if after_id:
+        query = query.filter(AssetHistory.id > after_id).order_by(AssetHistory.id.desc())
+    else:
+        query = query.order_by(AssetHistory.timestamp.desc())
+    return [serialize_activity(activity) for activity in query.limit(RECENT_ACTIVITY_LIMIT).all()]
+
+class DashboardBroadcaster:
+    def __init__(self):
+        self.summary: Optional[dict] = None
+        self.recent_activities: List[dict] = []
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def subscribe(self) -> asyncio.Queue:
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+        if self.summary is None:
+            await self._refresh()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=DASHBOARD_STREAM_QUEUE_SIZE)
+        queue.put_nowait(self._full_event())
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def notify(self):
+        if not self._subscribers:
+            self.summary = None
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            pass
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _full_event(self) -> DashboardEvent:
+        return "summary", {**self.summary, "recent_activities": self.recent_activities}
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=DASHBOARD_STREAM_REFRESH_SECONDS)
+                await asyncio.sleep(DASHBOARD_STREAM_DEBOUNCE_MS / 1000)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if not self._subscribers:
+                self.summary = None
+                continue
+            try:
+                await self._refresh()
+            except Exception as e:
+                print(f"Warning: Dashboard stream refresh failed: {e}")
+
+    async def _refresh(self):
+        last_id = self.recent_activities[0]["id"] if self.recent_activities else 0
+        snapshot, activities = await run_in_threadpool(self._load, last_id)
+        previous = self.summary
+        self.summary = snapshot
+        self.recent_activities = (activities + self.recent_activities)[:RECENT_ACTIVITY_LIMIT]
+        if previous is None:
+            return
+        delta = {key: value for key, value in snapshot.items() if previous.get(key) != value}
+        if delta:
+            self._publish(("summary", delta))
+        if activities:
+            self._publish(("activity", activities))
+
+    def _load(self, last_id: int):
+        db = SessionLocal()
+        try:
+            return get_summary_snapshot(db), load_recent_activities(db, last_id)
+        finally:
+            db.close()
+
+    def _publish(self, item: DashboardEvent):
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self._full_event())
+
+dashboard_broadcaster = DashboardBroadcaster()
+
+@event.listens_for(Session, "after_commit")
+def _notify_dashboard(session):
+    if session.info.pop("dashboard_dirty", None):
+        dashboard_broadcaster.notify()
+
+@event.listens_for(Session, "after_rollback")
+def _discard_dashboard_dirty(session):
+    session.info.pop("dashboard_dirty", None)
\ No newline at end of file
@@ -0,0 +1,138 @@
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Iterable, Optional, Tuple
+from sqlalchemy import func, insert, text
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session
+from models.asset import Asset
+from models.asset_stats import AssetStats
+from models.database import engine, MYSQL_DB
+from services.asset_loader import get_category_map
+
+DASHBOARD_RECONCILE_SECONDS = int(os.getenv("DASHBOARD_RECONCILE_SECONDS", "300"))
+
+StatsKey = Tuple[str, int, Optional[float]]
+
+def asset_stats_key(asset: Asset) -> StatsKey:
+    return (asset.status, asset.category_id, asset.current_value)
+
+def _stats_upsert(db: Session, values: dict):
+    if db.get_bind().dialect.name == "sqlite":
+        stmt = sqlite.insert(AssetStats).values(**values)
+        return stmt.on_conflict_do_update(
+            index_elements=[AssetStats.status, AssetStats.category_id],
+            set_={
+                "asset_count": AssetStats.asset_count + stmt.excluded.asset_count,
+                "total_value": AssetStats.total_value + stmt.excluded.total_value,
+            },
+        )
+    stmt = mysql.insert(AssetStats).values(**values)
+    return stmt.on_duplicate_key_update(
+        asset_count=AssetStats.asset_count + stmt.inserted.asset_count,
+        total_value=AssetStats.total_value + stmt.inserted.total_value,
+    )
+
+def apply_asset_changes(db: Session, removed: Iterable[StatsKey] = (), added: Iterable[StatsKey] = ()):
+    db.info["dashboard_dirty"] = True
+    deltas = defaultdict(lambda: [0, 0.0])
+    for sign, keys in ((-1, removed), (1, added)):
+        for status, category_id, value in keys:
+            delta = deltas[(status, category_id)]
+            delta[0] += sign
+            delta[1] += sign * (value or 0.0)
+
+    for (status, category_id), (count, value) in sorted(deltas.items()):
+        if count == 0 and value == 0:
+            continue
+        values = {"status": status, "category_id": category_id, "asset_count": count, "total_value": value}
+        db.execute(_stats_upsert(db, values))
+
+def get_summary_snapshot(db: Session) -> dict:
+    rows = db.query(
+        AssetStats.status,
+        AssetStats.category_id,
+        AssetStats.asset_count,
+        AssetStats.total_value,
+    ).filter(AssetStats.asset_count > 0).all()
+
+    categories = get_category_map(db, {row.category_id for row in rows})
+    by_status = defaultdict(int)
+    by_category = defaultdict(int)
+    total_value = 0.0
+    for row in rows:
+        by_status[row.status] += row.asset_count
+        category = categories.get(row.category_id)
+        if category:
+            by_category[category.name] += row.asset_count
+        total_value += row.total_value
+
+    return {
+        "total_assets": sum(by_status.values()),
+        "total_value": float(total_value),
+        "active_assets": by_status.get("Active", 0),
+        "maintenance_due": by_status.get("Maintenance", 0),
+        "category_distribution": [
+            {"name": name, "count": count} for name, count in by_category.items()
+        ],
+        "status_distribution": [
+            {"status": status, "count": count} for status, count in by_status.items()
+        ],
+    }
+
+def reconcile_asset_stats(db: Session):
+    db.query(AssetStats).with_for_update().all()
+    actual = db.query(
+        Asset.status,
+        Asset.category_id,
+        func.count(Asset.id),
+        func.coalesce(func.sum(Asset.current_value), 0),
+    ).group_by(Asset.status, Asset.category_id).all()
+
+    db.query(AssetStats).delete(synchronize_session=False)
+    if actual:
+        db.execute(insert(AssetStats), [
+            {"status": status, "category_id": category_id, "asset_count": count, "total_value": float(value)}
+            for status, category_id, count, value in actual
+        ])
+    db.commit()
+
+def run_reconciliation():
+    lock_name = f"asset_stats_reconcile_{MYSQL_DB}"
+    with engine.connect() as conn:
+        acquired = conn.execute(
+            text("SELECT GET_LOCK(:lock_name, 0)"),
+            {"lock_name": lock_name},
+        ).scalar()
+        conn.commit()
+        if not acquired:
+            return False
+        try:
+            db = Session(bind=conn)
+            try:
+                reconcile_asset_stats(db)
+            finally:
+                db.close()
+        finally:
+            conn.execute(
+                text("SELECT RELEASE_LOCK(:lock_name)"),
+                {"lock_name": lock_name},
+            )
+            conn.commit()
+        return True
+
+def _reconcile_forever(interval: int):
+    while True:
+        time.sleep(interval)
+        try:
+            run_reconciliation()
+        except Exception as e:
+            print(f"Warning: Asset stats reconciliation failed: {e}")
+
+def start_reconciler(interval: int = DASHBOARD_RECONCILE_SECONDS):
+    if interval <= 0:
+        return None
+    thread = threading.Thread(target=_reconcile_forever, args=(interval,), name="asset-stats-reconciler", daemon=True)
+    thread.start()
+    return thread
\ No newline at end of file
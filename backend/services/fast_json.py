@@ -0,0 +1,21 @@
+import os
+from typing import Any
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+FAST_JSON = os.getenv("FAST_JSON", "false").lower() == "true"
+
+def _default(value):
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps(content: Any) -> bytes:
+    import orjson
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
\ No newline at end of file
@@ -0,0 +1,46 @@
+from datetime import date
+from typing import Dict, List, Tuple
+from fastapi.encoders import jsonable_encoder
+from models.asset import Asset
+from models.asset_history import AssetHistory
+
+TRACKED_FIELDS = [
+    key for key in Asset.__table__.columns.keys()
+    if key not in ("id", "created_at", "updated_at")
+]
+
+_DATE_FIELDS = {"purchase_date"}
+
+def diff_asset(asset: Asset, updates: dict) -> Dict[str, list]:
+    changes = {}
+    for key, value in updates.items():
+        old = getattr(asset, key)
+        if old != value:
+            changes[key] = [old, value]
+    return jsonable_encoder(changes)
+
+def snapshot_changes(values: dict) -> Dict[str, list]:
+    return jsonable_encoder({
+        key: [None, values[key]]
+        for key in TRACKED_FIELDS
+        if values.get(key) is not None
+    })
+
+def _decode(key: str, value):
+    if value is not None and key in _DATE_FIELDS:
+        return date.fromisoformat(value)
+    return value
+
+def reconstruct_asset(asset: Asset, later_history: List[AssetHistory]) -> Tuple[dict, bool]:
+    state = {key: getattr(asset, key) for key in TRACKED_FIELDS}
+    complete = True
+    for entry in sorted(later_history, key=lambda row: (row.timestamp, row.id), reverse=True):
+        if entry.action != "UPDATE":
+            continue
+        if entry.changes is None:
+            complete = False
+            continue
+        for key, (old, _) in entry.changes.items():
+            if key in state:
+                state[key] = _decode(key, old)
+    return state, complete
\ No newline at end of file
@@ -0,0 +1,104 @@
+import gzip
+import json
+import os
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+HISTORY_RETENTION_MONTHS = int(os.getenv("HISTORY_RETENTION_MONTHS", "0"))
+HISTORY_PARTITIONS_AHEAD = int(os.getenv("HISTORY_PARTITIONS_AHEAD", "3"))
+HISTORY_ARCHIVE_DIR = os.getenv("HISTORY_ARCHIVE_DIR", "")
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+def list_partitions(conn: Connection) -> List[Tuple[str, Optional[date]]]:
+    rows = conn.execute(text(
+        "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'asset_history' "
+        "AND PARTITION_NAME IS NOT NULL ORDER BY PARTITION_ORDINAL_POSITION"
+    )).all()
+    partitions = []
+    for name, description in rows:
+        upper = None
+        if description and description != "MAXVALUE":
+            upper = date.fromisoformat(description.strip("'")[:10])
+        partitions.append((name, upper))
+    return partitions
+
+def history_retained_since(conn: Connection) -> Optional[datetime]:
+    if conn.dialect.name != "mysql":
+        return None
+    for name, _ in list_partitions(conn):
+        if name != "pmax":
+            return datetime.strptime(name[1:], "%Y%m")
+    return None
+
+def roll_forward(conn: Connection, ahead: int = HISTORY_PARTITIONS_AHEAD, dry_run: bool = False) -> List[str]:
+    partitions = list_partitions(conn)
+    if not partitions:
+        print("Warning: asset_history is not partitioned; run the migrations first")
+        return []
+    bounds = [upper for _, upper in partitions if upper is not None]
+    this_month = datetime.utcnow().date().replace(day=1)
+    month = max(bounds) if bounds else this_month
+    last = add_months(this_month, ahead)
+
+    clauses, created = [], []
+    while month <= last:
+        upper = add_months(month, 1)
+        clauses.append(f"PARTITION {partition_name(month)} VALUES LESS THAN ('{upper.isoformat()}')")
+        created.append(partition_name(month))
+        month = upper
+    if clauses and not dry_run:
+        clauses.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+        conn.execute(text(
+            "ALTER TABLE asset_history REORGANIZE PARTITION pmax INTO (" + ", ".join(clauses) + ")"
+        ))
+    return created
+
+def archive_partition(conn: Connection, name: str, archive_dir: str) -> Tuple[str, int]:
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(archive_dir, f"asset_history_{name}.ndjson.gz")
+    tmp_path = f"{path}.tmp"
+    count = 0
+    result = conn.execution_options(stream_results=True).execute(text(
+        f"SELECT id, asset_id, action, details, changes, timestamp "
+        f"FROM asset_history PARTITION ({name}) ORDER BY timestamp, id"
+    ))
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        for row in result.mappings():
+            entry = dict(row)
+            entry["timestamp"] = entry["timestamp"].isoformat()
+            if isinstance(entry["changes"], str):
+                entry["changes"] = json.loads(entry["changes"])
+            f.write(json.dumps(entry) + "\n")
+            count += 1
+    os.replace(tmp_path, path)
+    return path, count
+
+def expire_partitions(
+    conn: Connection,
+    retention_months: int = HISTORY_RETENTION_MONTHS,
+    archive_dir: str = HISTORY_ARCHIVE_DIR,
+    dry_run: bool = False,
+) -> List[dict]:
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(datetime.utcnow().date().replace(day=1), -retention_months)
+    expired = []
+    for name, upper in list_partitions(conn):
+        if upper is None or upper > cutoff:
+            continue
+        entry = {"partition": name, "archive": None, "rows": None}
+        if not dry_run:
+            if archive_dir:
+                entry["archive"], entry["rows"] = archive_partition(conn, name, archive_dir)
+            conn.execute(text(f"ALTER TABLE asset_history DROP PARTITION {name}"))
+        expired.append(entry)
+    return expired
\ No newline at end of file
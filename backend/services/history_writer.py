@@ -0,0 +1,103 @@
+import os
+import queue
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import event, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from models.asset_history import AssetHistory
+from models.database import SessionLocal
+
+ASYNC_HISTORY_WRITES = os.getenv("ASYNC_HISTORY_WRITES", "false").lower() == "true"
+HISTORY_BATCH_SIZE = int(os.getenv("HISTORY_BATCH_SIZE", "500"))
+HISTORY_FLUSH_INTERVAL_MS = int(os.getenv("HISTORY_FLUSH_INTERVAL_MS", "200"))
+
+class HistoryWriter:
+    def __init__(self, batch_size: int, flush_interval_ms: int):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._queue: "queue.Queue[Optional[dict]]" = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, rows: List[dict]):
+        self._ensure_started()
+        for row in rows:
+            self._queue.put(row)
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            row = self._queue.get()
+            if row is None:
+                return
+            batch = [row]
+            stopping = False
+            while len(batch) < self.batch_size:
+                try:
+                    row = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                batch.append(row)
+            self._flush(batch)
+            if stopping:
+                return
+
+    def _flush(self, batch: List[dict]):
+        db = SessionLocal()
+        db.info["dashboard_dirty"] = True
+        try:
+            db.execute(insert(AssetHistory).values(batch))
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+            for row in batch:
+                try:
+                    db.execute(insert(AssetHistory).values(row))
+                    db.commit()
+                except SQLAlchemyError as e:
+                    db.rollback()
+                    print(f"Warning: Dropped history entry for asset {row['asset_id']}: {e}")
+        finally:
+            db.close()
+
+history_writer = HistoryWriter(HISTORY_BATCH_SIZE, HISTORY_FLUSH_INTERVAL_MS) if ASYNC_HISTORY_WRITES else None
+
+def record_history(db: Session, asset_id: int, action: str, details: str, changes: Optional[Dict[str, list]] = None):
+    row = {
+        "asset_id": asset_id,
+        "action": action,
+        "details": details,
+        "changes": changes,
+        "timestamp": datetime.utcnow(),
+    }
+    if history_writer is None:
+        db.add(AssetHistory(**row))
+    else:
+        db.info.setdefault("pending_history", []).append(row)
+
+@event.listens_for(Session, "after_commit")
+def _submit_pending_history(session):
+    rows = session.info.pop("pending_history", None)
+    if rows and history_writer is not None:
+        history_writer.submit(rows)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_history(session):
+    session.info.pop("pending_history", None)
\ No newline at end of file
@@ -0,0 +1,39 @@
+import io
+import os
+from typing import Dict
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+RENDITION_SIZES = {
+    "thumb": int(os.getenv("RENDITION_THUMB_PX", "160")),
+    "medium": int(os.getenv("RENDITION_MEDIUM_PX", "800")),
+}
+RENDITION_FORMAT = os.getenv("RENDITION_FORMAT", "webp").lower()
+RENDITION_QUALITY = int(os.getenv("RENDITION_QUALITY", "80"))
+
+_CONTENT_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg"}
+_EXTENSIONS = {"webp": ".webp", "jpeg": ".jpg"}
+
+RENDITION_CONTENT_TYPE = _CONTENT_TYPES[RENDITION_FORMAT]
+
+def rendition_path(blob_path: str, size: str) -> str:
+    stem = os.path.splitext(blob_path)[0]
+    return f"{stem}.{size}{_EXTENSIONS[RENDITION_FORMAT]}"
+
+def build_renditions(source) -> Dict[str, bytes]:
+    largest = max(RENDITION_SIZES.values())
+    try:
+        with Image.open(source) as image:
+            image.draft("RGB", (largest, largest))
+            image = ImageOps.exif_transpose(image)
+            if image.mode not in ("RGB", "RGBA") or RENDITION_FORMAT == "jpeg":
+                image = image.convert("RGB")
+            renditions = {}
+            for name, edge in sorted(RENDITION_SIZES.items(), key=lambda item: -item[1]):
+                image.thumbnail((edge, edge))
+                buffer = io.BytesIO()
+                image.save(buffer, format=RENDITION_FORMAT.upper(), quality=RENDITION_QUALITY)
+                renditions[name] = buffer.getvalue()
+            return renditions
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError) as e:
+        print(f"Warning: Could not build image renditions: {e}")
+        return {}
\ No newline at end of file
@@ -0,0 +1,138 @@
+import os
+import time
+from contextvars import ContextVar
+from typing import Optional
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from services.pool_metrics import POOL_METRICS, WAIT_BUCKETS
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "true").lower() == "true"
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ["method", "route", "status"],
+)
+REQUEST_STATEMENTS = Histogram(
+    "http_request_db_statements", "SQL statements issued per request", ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 500),
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_duration_seconds", "Time spent in SQL per request", ["route"],
+)
+DB_STATEMENT_LATENCY = Histogram(
+    "db_statement_duration_seconds", "SQL statement latency by operation", ["operation"],
+)
+SLOW_QUERIES = Counter("db_slow_queries_total", "SQL statements slower than SLOW_QUERY_MS", ["route"])
+BLOB_CACHE_REQUESTS = Counter("blob_cache_requests_total", "File requests by cache result", ["result"])
+BLOB_FETCHES = Counter("blob_fetches_total", "Blob storage fetches by kind", ["kind"])
+
+class RequestStats:
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.statements = 0
+        self.db_seconds = 0.0
+
+    @property
+    def route(self) -> str:
+        route = self.scope.get("route")
+        return getattr(route, "path", "unmatched")
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = RequestStats(scope)
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if SERVER_TIMING_ENABLED:
+                    elapsed = (time.perf_counter() - started) * 1000
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing",
+                        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.statements} queries", app;dur={elapsed:.1f}',
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            route = stats.route
+            REQUEST_LATENCY.labels(scope["method"], route, str(status)).observe(time.perf_counter() - started)
+            REQUEST_STATEMENTS.labels(route).observe(stats.statements)
+            REQUEST_DB_TIME.labels(route).observe(stats.db_seconds)
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("statement_started", []).append(time.perf_counter())
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["statement_started"].pop()
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "UNKNOWN"
+    DB_STATEMENT_LATENCY.labels(operation).observe(elapsed)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_seconds += elapsed
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        route = stats.route if stats is not None else "background"
+        SLOW_QUERIES.labels(route).inc()
+        print(f"Warning: Slow query ({elapsed * 1000:.0f} ms) from {route}: {' '.join(statement.split())[:500]}")
+
+@event.listens_for(Engine, "handle_error")
+def _discard_statement_timer(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("statement_started"):
+        connection.info["statement_started"].pop()
+
+class CallbackCollector:
+    def __init__(self, collect):
+        self.collect = collect
+
+def register_blob_cache(cache):
+    def collect():
+        family = CounterMetricFamily("blob_cache_tier_events", "Blob cache events by tier", labels=["tier", "event"])
+        for tier, counts in cache.stats().items():
+            for name, value in counts.items():
+                family.add_metric([tier, name], value)
+        yield family
+    REGISTRY.register(CallbackCollector(collect))
+
+def _collect_pools():
+    sizes = GaugeMetricFamily("db_pool_connections", "Connection pool state", labels=["pool", "state"])
+    events = CounterMetricFamily("db_pool_events", "Connection pool events", labels=["pool", "event"])
+    waits = HistogramMetricFamily("db_pool_wait_seconds", "Time waiting for a pooled connection", labels=["pool"])
+    for name, metrics in POOL_METRICS.items():
+        if metrics.pool is None:
+            continue
+        snapshot = metrics.snapshot()
+        for state in ("size", "checked_in", "checked_out", "overflow"):
+            sizes.add_metric([name, state], snapshot[state])
+        for counter in ("connects", "checkouts", "overflow_checkouts", "timeouts", "invalidations", "soft_invalidations", "idle_ping_failures"):
+            events.add_metric([name, counter], snapshot[counter])
+        wait = snapshot["wait_seconds"]
+        buckets = [(str(bound), wait["buckets"][str(bound)]) for bound in WAIT_BUCKETS]
+        waits.add_metric([name], buckets + [("+Inf", wait["count"])], wait["sum"])
+    yield sizes
+    yield events
+    yield waits
+
+REGISTRY.register(CallbackCollector(_collect_pools))
+
+def render_metrics():
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
\ No newline at end of file
@@ -0,0 +1,59 @@
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from models.database import engine, SessionLocal, MYSQL_DB, DATABASE_URL
+from models.category import Category
+
+DEFAULT_CATEGORIES = [
+    ("Electronics", "Electronic devices and equipment"),
+    ("Furniture", "Office and home furniture"),
+    ("Vehicles", "Company vehicles and transportation"),
+    ("Software", "Software licenses and subscriptions"),
+    ("Equipment", "General equipment and tools"),
+]
+
+def alembic_config() -> Config:
+    alembic_cfg = Config("alembic.ini")
+    alembic_cfg.set_main_option("sqlalchemy.url", DATABASE_URL.replace("%", "%%"))
+    return alembic_cfg
+
+def schema_is_current() -> bool:
+    heads = set(ScriptDirectory.from_config(alembic_config()).get_heads())
+    try:
+        with engine.connect() as conn:
+            current = set(MigrationContext.configure(conn).get_current_heads())
+    except SQLAlchemyError as e:
+        print(f"Warning: Could not read schema version: {e}")
+        return False
+    return current == heads
+
+def run_migrations():
+    lock_name = f"migration_lock_{MYSQL_DB}"
+    with engine.connect() as conn:
+        acquired = conn.execute(
+            text("SELECT GET_LOCK(:lock_name, 60)"),
+            {"lock_name": lock_name},
+        ).scalar()
+        if not acquired:
+            raise RuntimeError("Could not acquire migration lock")
+        try:
+            command.upgrade(alembic_config(), "head")
+        finally:
+            conn.execute(
+                text("SELECT RELEASE_LOCK(:lock_name)"),
+                {"lock_name": lock_name},
+            )
+
+def seed_default_categories() -> int:
+    db = SessionLocal()
+    try:
+        if db.query(Category).count() > 0:
+            return 0
+        db.add_all([Category(name=name, description=description) for name, description in DEFAULT_CATEGORIES])
+        db.commit()
+        return len(DEFAULT_CATEGORIES)
+    finally:
+        db.close()
\ No newline at end of file
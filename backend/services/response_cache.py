@@ -0,0 +1,157 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Callable, Iterable, Optional, Tuple
+from urllib.parse import urlencode
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from models.database import PRIMARY_STICKY_SECONDS, reads_from_primary
+from services.blob_cache import MemoryBlobCache
+from services.fast_json import FAST_JSON, dumps
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "60"))
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+RESPONSE_CACHE_REDIS_URL = os.getenv("RESPONSE_CACHE_REDIS_URL", "")
+RESPONSE_CACHE_REPLICA_FILL_DELAY_SECONDS = float(os.getenv("RESPONSE_CACHE_REPLICA_FILL_DELAY_SECONDS", str(PRIMARY_STICKY_SECONDS)))
+RESPONSE_CACHE_PREFIX = "vault:response:"
+
+class MemoryResponseCache:
+    name = "memory"
+
+    def __init__(self, max_bytes: int, ttl_seconds: int):
+        self._entries = MemoryBlobCache(max_bytes, ttl_seconds)
+        self._versions = {}
+        self._invalidated_at = {}
+        self._lock = threading.Lock()
+
+    def versions(self, tags: Iterable[str]) -> Tuple[Tuple[int, ...], float]:
+        with self._lock:
+            tags = list(tags)
+            versions = tuple(self._versions.get(tag, 0) for tag in tags)
+            return versions, max((self._invalidated_at.get(tag, 0.0) for tag in tags), default=0.0)
+
+    def invalidate(self, tags: Iterable[str]):
+        now = time.time()
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+                self._invalidated_at[tag] = now
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        entry = self._entries.get(key)
+        return (entry[0], entry[1]["etag"]) if entry else None
+
+    def set(self, key: str, body: bytes, etag: str):
+        self._entries.set(key, body, {"etag": etag})
+
+class RedisResponseCache:
+    name = "redis"
+
+    def __init__(self, url: str, ttl_seconds: int):
+        import redis
+        self.ttl_seconds = ttl_seconds
+        self._client = redis.Redis.from_url(url)
+
+    def versions(self, tags: Iterable[str]) -> Tuple[Tuple[int, ...], float]:
+        tags = list(tags)
+        if not tags:
+            return (), 0.0
+        values = self._client.mget(
+            [f"{RESPONSE_CACHE_PREFIX}tag:{tag}" for tag in tags]
+            + [f"{RESPONSE_CACHE_PREFIX}tag_at:{tag}" for tag in tags]
+        )
+        versions = tuple(int(value or 0) for value in values[:len(tags)])
+        return versions, max(float(value or 0) for value in values[len(tags):])
+
+    def invalidate(self, tags: Iterable[str]):
+        now = time.time()
+        pipeline = self._client.pipeline()
+        for tag in tags:
+            pipeline.incr(f"{RESPONSE_CACHE_PREFIX}tag:{tag}")
+            pipeline.set(f"{RESPONSE_CACHE_PREFIX}tag_at:{tag}", now, ex=int(RESPONSE_CACHE_REPLICA_FILL_DELAY_SECONDS) + 1)
+        pipeline.execute()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        value = self._client.get(RESPONSE_CACHE_PREFIX + key)
+        if value is None:
+            return None
+        etag, _, body = value.partition(b"\n")
+        return body, etag.decode()
+
+    def set(self, key: str, body: bytes, etag: str):
+        self._client.set(RESPONSE_CACHE_PREFIX + key, etag.encode() + b"\n" + body, ex=self.ttl_seconds)
+
+def create_response_cache():
+    if not RESPONSE_CACHE_ENABLED:
+        return None
+    if RESPONSE_CACHE_REDIS_URL:
+        try:
+            return RedisResponseCache(RESPONSE_CACHE_REDIS_URL, RESPONSE_CACHE_TTL_SECONDS)
+        except ImportError:
+            print("Warning: redis is not installed, falling back to the in-process response cache")
+    return MemoryResponseCache(RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE_TTL_SECONDS)
+
+response_cache = create_response_cache()
+
+def invalidate_responses(*tags: str):
+    if response_cache is None:
+        return
+    try:
+        response_cache.invalidate(tags)
+    except Exception as e:
+        print(f"Warning: Could not invalidate cached responses: {e}")
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+def lookup_response(request: Request, tags: Tuple[str, ...]) -> Tuple[Optional[Response], Optional[str], bool]:
+    entry = key = None
+    storable = True
+    if response_cache is not None:
+        try:
+            versions, invalidated_at = response_cache.versions(tags)
+            query = urlencode(sorted(request.query_params.multi_items()))
+            key = f"{request.url.path}?{query}#" + ",".join(f"{tag}:{version}" for tag, version in zip(tags, versions))
+            # Clients pinned to the primary after a write must see it, and a
+            # lagging replica can still return pre-write rows for a while
+            # after the version bump.
+            if not reads_from_primary(request):
+                entry = response_cache.get(key)
+            if getattr(request.state, "db_replica", None):
+                storable = time.time() - invalidated_at >= RESPONSE_CACHE_REPLICA_FILL_DELAY_SECONDS
+        except Exception as e:
+            print(f"Warning: Response cache lookup failed: {e}")
+            key = None
+    if entry is None:
+        return None, key, storable
+    body, etag = entry
+    return json_response(request, body, etag), key, storable
+
+def store_response(request: Request, key: Optional[str], storable: bool, content) -> Response:
+    body = dumps(content) if FAST_JSON else json.dumps(jsonable_encoder(content), separators=(",", ":")).encode()
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    if key is not None and storable:
+        try:
+            response_cache.set(key, body, etag)
+        except Exception as e:
+            print(f"Warning: Could not store cached response: {e}")
+    return json_response(request, body, etag)
+
+def json_response(request: Request, body: bytes, etag: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+def cached_json(request: Request, tags: Tuple[str, ...], build: Callable[[], object]) -> Response:
+    response, key, storable = lookup_response(request, tags)
+    if response is not None:
+        return response
+    return store_response(request, key, storable, build())
\ No newline at end of file
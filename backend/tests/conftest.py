@@ -0,0 +1,59 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("RESPONSE_CACHE_ENABLED", "false")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from models.database import Base, get_db, get_read_db
+import models.asset
+import models.asset_stats
+import models.asset_tombstone
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    with engine.begin() as conn:
+        # SQLite cannot autoincrement the (id, timestamp) key MySQL partitions on.
+        conn.execute(text(
+            "CREATE TABLE asset_history (id INTEGER PRIMARY KEY AUTOINCREMENT, asset_id INTEGER NOT NULL, "
+            "action VARCHAR(50) NOT NULL, details TEXT, changes JSON, timestamp DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        ))
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+@pytest.fixture
+def client(session_factory):
+    import main
+
+    def override():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    main.app.dependency_overrides[get_db] = override
+    main.app.dependency_overrides[get_read_db] = override
+    yield TestClient(main.app)
+    main.app.dependency_overrides.clear()
\ No newline at end of file
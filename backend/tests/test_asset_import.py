@@ -0,0 +1,41 @@
+import json
+from models.asset import Asset
+from models.asset_history import AssetHistory
+from models.category import Category
+from services import asset_import
+
+def seed_categories(session_factory):
+    db = session_factory()
+    db.add_all([Category(name="Laptops"), Category(name="Desks")])
+    db.add(Asset(name="Asset 3", status="Active", category_id=1))
+    db.commit()
+    db.close()
+
+def ndjson(records) -> bytes:
+    return "\n".join(json.dumps(record) for record in records).encode()
+
+def test_create_history_points_at_the_imported_assets(client, session_factory, monkeypatch):
+    monkeypatch.setattr(asset_import, "BULK_IMPORT_BATCH_SIZE", 40)
+    seed_categories(session_factory)
+    records = [
+        {"name": f"Asset {index}", "category_id": index % 2 + 1, "serial_number": f"SN-{index}" if index % 3 else None}
+        for index in range(100)
+    ]
+    records[10]["category_id"] = 99
+    response = client.post("/api/assets/bulk?format=ndjson", content=ndjson(records))
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["created"], report["failed"]) == (99, 1)
+    assert report["errors"][0]["row"] == 11
+
+    db = session_factory()
+    assets = {asset.id: asset for asset in db.query(Asset)}
+    history = db.query(AssetHistory).filter(AssetHistory.action == "CREATE").all()
+    db.close()
+    assert len(history) == 99
+    for entry in history:
+        asset = assets[entry.asset_id]
+        assert entry.details == f"Asset '{asset.name}' created"
+        assert entry.changes["name"] == [None, asset.name]
+        assert entry.changes["category_id"] == [None, asset.category_id]
+        assert entry.changes.get("serial_number", [None, None])[1] == asset.serial_number
\ No newline at end of file
@@ -0,0 +1,42 @@
+import pytest
+from models.asset import Asset
+from models.category import Category
+from services import asset_loader
+
+def seed(session_factory, count: int):
+    db = session_factory()
+    categories = [Category(name=f"Category {index}") for index in range(5)]
+    db.add_all(categories)
+    db.flush()
+    db.add_all([
+        Asset(name=f"Asset {index}", status="Active", category_id=categories[index % len(categories)].id)
+        for index in range(count)
+    ])
+    db.commit()
+    db.close()
+
+def count_statements(client, statements, url: str) -> int:
+    asset_loader.invalidate_category_map()
+    statements.clear()
+    response = client.get(url)
+    assert response.status_code == 200
+    return len(statements)
+
+@pytest.mark.parametrize("strategy", ["map", "joined", "selectin"])
+@pytest.mark.parametrize("url", ["/api/assets", "/api/assets?limit=50", "/api/assets?status=Active"])
+def test_list_statement_count_is_constant(client, session_factory, statements, monkeypatch, strategy, url):
+    monkeypatch.setattr(asset_loader, "ASSET_LOADER_STRATEGY", strategy)
+    seed(session_factory, 3)
+    small = count_statements(client, statements, url)
+    seed_more = session_factory()
+    seed_more.add_all([Asset(name=f"Extra {index}", status="Active", category_id=(index % 5) + 1) for index in range(40)])
+    seed_more.commit()
+    seed_more.close()
+    assert count_statements(client, statements, url) == small
+
+def test_category_map_is_reused_between_requests(client, session_factory, statements):
+    seed(session_factory, 10)
+    count_statements(client, statements, "/api/assets")
+    statements.clear()
+    client.get("/api/assets")
+    assert not any("FROM categories" in statement for statement in statements)
\ No newline at end of file
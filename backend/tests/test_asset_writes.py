@@ -0,0 +1,146 @@
+from datetime import datetime, timedelta
+import pytest
+from models.asset import Asset
+from models.asset_history import AssetHistory
+from models.asset_stats import AssetStats
+from models.asset_tombstone import AssetTombstone
+from models.category import Category
+from services.history_diff import reconstruct_asset
+
+@pytest.fixture
+def categories(session_factory):
+    db = session_factory()
+    db.add_all([Category(name="Laptops"), Category(name="Desks")])
+    db.commit()
+    db.close()
+    return [1, 2]
+
+def stats(session_factory) -> dict:
+    db = session_factory()
+    try:
+        return {
+            (row.status, row.category_id): (row.asset_count, row.total_value)
+            for row in db.query(AssetStats)
+            if row.asset_count
+        }
+    finally:
+        db.close()
+
+def history(session_factory, asset_id: int) -> list:
+    db = session_factory()
+    try:
+        return [
+            (row.action, row.changes)
+            for row in db.query(AssetHistory).filter(AssetHistory.asset_id == asset_id).order_by(AssetHistory.id)
+        ]
+    finally:
+        db.close()
+
+def create(client, **values) -> dict:
+    response = client.post("/api/assets", json={"name": "Asset", "category_id": 1, **values})
+    assert response.status_code == 201, response.text
+    return response.json()
+
+def test_create_records_stats_and_history(client, session_factory, categories):
+    asset = create(client, name="ThinkPad", current_value=1200.0)
+    assert stats(session_factory) == {("Active", 1): (1, 1200.0)}
+    assert history(session_factory, asset["id"]) == [
+        ("CREATE", {"name": [None, "ThinkPad"], "current_value": [None, 1200.0], "status": [None, "Active"], "category_id": [None, 1]}),
+    ]
+
+def test_update_moves_stats_and_records_the_diff(client, session_factory, categories):
+    asset = create(client, current_value=100.0)
+    response = client.patch(f"/api/assets/{asset['id']}", json={"status": "Maintenance", "current_value": 80.0})
+    assert response.status_code == 200
+    assert stats(session_factory) == {("Maintenance", 1): (1, 80.0)}
+    assert history(session_factory, asset["id"])[-1] == (
+        "UPDATE", {"current_value": [100.0, 80.0], "status": ["Active", "Maintenance"]},
+    )
+
+def test_noop_patch_writes_nothing(client, session_factory, categories):
+    asset = create(client, current_value=100.0)
+    response = client.patch(f"/api/assets/{asset['id']}", json={"current_value": 100.0, "status": "Active"})
+    assert response.status_code == 200
+    assert response.json()["updated_at"] == asset["updated_at"]
+    assert [action for action, _ in history(session_factory, asset["id"])] == ["CREATE"]
+    assert stats(session_factory) == {("Active", 1): (1, 100.0)}
+
+def test_delete_removes_stats_and_history_and_leaves_a_tombstone(client, session_factory, categories):
+    keep = create(client, current_value=5.0)
+    gone = create(client, current_value=7.0)
+    assert client.delete(f"/api/assets/{gone['id']}").status_code == 204
+    assert stats(session_factory) == {("Active", 1): (1, 5.0)}
+    assert history(session_factory, gone["id"]) == []
+    db = session_factory()
+    assert [row.asset_id for row in db.query(AssetTombstone)] == [gone["id"]]
+    db.close()
+    assert client.get(f"/api/assets/{keep['id']}").status_code == 200
+
+def test_bulk_update_applies_to_the_filter_and_records_history(client, session_factory, categories):
+    laptops = [create(client, category_id=1, current_value=10.0) for _ in range(3)]
+    desk = create(client, category_id=2, current_value=20.0)
+    already = create(client, category_id=1, status="Retired", current_value=1.0)
+    response = client.patch("/api/assets/bulk", json={"filter": {"category_id": 1}, "changes": {"status": "Retired"}})
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["matched"], body["updated"]) == (4, 3)
+    assert sorted(body["ids"]) == [asset["id"] for asset in laptops]
+    assert stats(session_factory) == {("Retired", 1): (4, 31.0), ("Active", 2): (1, 20.0)}
+    assert history(session_factory, laptops[0]["id"])[-1] == ("UPDATE", {"status": ["Active", "Retired"]})
+    assert [action for action, _ in history(session_factory, already["id"])] == ["CREATE"]
+    assert [action for action, _ in history(session_factory, desk["id"])] == ["CREATE"]
+
+def test_bulk_delete_by_ids(client, session_factory, categories):
+    assets = [create(client, current_value=float(index)) for index in range(1, 5)]
+    ids = [assets[0]["id"], assets[2]["id"]]
+    response = client.request("DELETE", "/api/assets/bulk", json={"ids": ids})
+    assert response.status_code == 200
+    assert sorted(response.json()["ids"]) == ids
+    assert stats(session_factory) == {("Active", 1): (2, 6.0)}
+    assert all(history(session_factory, asset_id) == [] for asset_id in ids)
+    db = session_factory()
+    assert sorted(row.asset_id for row in db.query(AssetTombstone)) == ids
+    db.close()
+
+def test_bulk_requires_a_selection(client, categories):
+    response = client.patch("/api/assets/bulk", json={"changes": {"status": "Retired"}})
+    assert response.status_code == 422
+
+def test_reconstruct_asset_rolls_back_later_updates():
+    asset = Asset(name="Chair", status="Retired", category_id=1, current_value=10.0, purchase_date=None)
+    start = datetime(2024, 1, 1)
+    later = [
+        AssetHistory(id=2, action="UPDATE", timestamp=start + timedelta(days=1), changes={"current_value": [50.0, 30.0]}),
+        AssetHistory(id=3, action="UPDATE", timestamp=start + timedelta(days=2), changes={"current_value": [30.0, 10.0], "status": ["Active", "Retired"]}),
+        AssetHistory(id=4, action="UPDATE", timestamp=start + timedelta(days=3), changes={"purchase_date": ["2023-05-01", None]}),
+    ]
+    state, complete = reconstruct_asset(asset, later)
+    assert complete
+    assert (state["current_value"], state["status"], state["name"]) == (50.0, "Active", "Chair")
+    assert state["purchase_date"].isoformat() == "2023-05-01"
+
+def test_reconstruct_asset_flags_updates_without_diffs():
+    asset = Asset(name="Chair", status="Active", category_id=1)
+    state, complete = reconstruct_asset(asset, [AssetHistory(id=1, action="UPDATE", timestamp=datetime(2024, 1, 1), changes=None)])
+    assert not complete
+    assert state["name"] == "Chair"
+
+def test_as_of_returns_earlier_values(client, categories):
+    asset = create(client, current_value=100.0)
+    before_update = datetime.utcnow()
+    client.patch(f"/api/assets/{asset['id']}", json={"current_value": 60.0})
+    response = client.get(f"/api/assets/{asset['id']}/as-of", params={"at": before_update.isoformat()})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["complete"]
+    assert body["fields"]["current_value"] == 100.0
+
+def test_as_of_before_retained_history_is_incomplete(client, categories, monkeypatch):
+    from routers import assets
+    asset = create(client, current_value=100.0)
+    before_update = datetime.utcnow()
+    client.patch(f"/api/assets/{asset['id']}", json={"current_value": 60.0})
+    monkeypatch.setattr(assets, "history_retained_since", lambda conn: datetime.utcnow() + timedelta(days=1))
+    response = client.get(f"/api/assets/{asset['id']}/as-of", params={"at": before_update.isoformat()})
+    assert response.status_code == 200
+    assert not response.json()["complete"]
\ No newline at end of file
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from models.database import get_async_read_db, get_read_db
+from routers import db_handler as handlers
+
+SERIALIZE_SECONDS = 0.5
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+@pytest.fixture
+async def async_app(monkeypatch):
+    monkeypatch.setattr(handlers, "DB_ASYNC", True)
+    engine = create_async_engine("sqlite+aiosqlite://")
+    session_factory = async_sessionmaker(engine)
+    threads = {}
+    app = FastAPI()
+
+    async def override():
+        async with session_factory() as db:
+            yield db
+
+    def serialize(value):
+        threads["serialize"] = threading.get_ident()
+        time.sleep(SERIALIZE_SECONDS)
+        return {"value": value}
+
+    @app.get("/slow")
+    @handlers.db_handler
+    def slow(db: Session = Depends(get_read_db)):
+        threads["query"] = threading.get_ident()
+        return handlers.offload(serialize, db.execute(text("SELECT 1")).scalar())
+
+    @app.get("/fast")
+    @handlers.db_handler
+    def fast(db: Session = Depends(get_read_db)):
+        return {"value": db.execute(text("SELECT 2")).scalar()}
+
+    app.dependency_overrides[get_async_read_db] = override
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client, threads
+    await engine.dispose()
+
+@pytest.mark.anyio
+async def test_offloaded_work_leaves_the_event_loop(async_app):
+    client, threads = async_app
+    response = await client.get("/slow")
+    assert response.json() == {"value": 1}
+    assert threads["query"] == threading.get_ident()
+    assert threads["serialize"] != threading.get_ident()
+
+@pytest.mark.anyio
+async def test_slow_serialization_does_not_block_other_requests(async_app):
+    client, _ = async_app
+    started = time.perf_counter()
+    slow = asyncio.create_task(client.get("/slow"))
+    await asyncio.sleep(0.05)
+    response = await client.get("/fast")
+    assert response.json() == {"value": 2}
+    assert time.perf_counter() - started < SERIALIZE_SECONDS / 2
+    assert (await slow).status_code == 200
\ No newline at end of file
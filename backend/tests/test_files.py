@@ -0,0 +1,157 @@
+import asyncio
+import hashlib
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+import httpx
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+from routers import files
+from services.blob_cache import MemoryBlobCache, create_blob_cache
+
+DOWNLOAD_DELAY = 0.2
+
+class FakeDownloader:
+    def __init__(self, data: bytes, properties):
+        self.data = data
+        self.properties = properties
+
+    async def readall(self):
+        return self.data
+
+class FakeBlobClient:
+    def __init__(self, storage: "FakeBlobService", path: str):
+        self.storage = storage
+        self.path = path
+
+    def _properties(self, offset=None, length=None):
+        data, content_type = self.storage.blobs[self.path]
+        size = len(data)
+        end = size - 1 if length is None else min(size - 1, (offset or 0) + length - 1)
+        return SimpleNamespace(
+            etag=f"0x{size:X}",
+            last_modified=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            size=end - (offset or 0) + 1,
+            content_range=f"bytes {offset or 0}-{end}/{size}",
+            content_settings=SimpleNamespace(content_type=content_type),
+        )
+
+    async def download_blob(self, offset=None, length=None):
+        self.storage.downloads.append(self.path)
+        await asyncio.sleep(self.storage.delay)
+        if self.path not in self.storage.blobs:
+            raise ResourceNotFoundError("The specified blob does not exist.")
+        data = self.storage.blobs[self.path][0]
+        if offset is not None:
+            data = data[offset:offset + length] if length else data[offset:]
+        return FakeDownloader(data, self._properties(offset, length))
+
+    async def upload_blob(self, data, overwrite=True, content_settings=None):
+        self.storage.blobs[self.path] = (data, content_settings.content_type)
+
+    async def stage_block(self, block_id, data, **kwargs):
+        self.storage.staged.setdefault(self.path, {})[block_id] = bytes(data)
+
+    async def commit_block_list(self, block_list, content_settings=None, **kwargs):
+        staged = self.storage.staged.pop(self.path)
+        data = b"".join(staged[block.id] for block in block_list)
+        self.storage.blobs[self.path] = (data, content_settings.content_type)
+
+class FakeBlobService:
+    def __init__(self):
+        self.blobs = {}
+        self.staged = {}
+        self.downloads = []
+        self.delay = 0.0
+
+    def get_blob_client(self, container, blob):
+        return FakeBlobClient(self, blob)
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+@pytest.fixture
+def storage(monkeypatch):
+    service = FakeBlobService()
+    monkeypatch.setattr(files, "get_blob_service_client", lambda: service)
+    monkeypatch.setattr(files, "AZURE_STORAGE_CONTAINER", "test")
+    monkeypatch.setattr(files, "blob_cache", create_blob_cache())
+    monkeypatch.setattr(files, "missing_renditions", MemoryBlobCache(1024, 60))
+    return service
+
+@pytest.fixture
+async def http():
+    import main
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as client:
+        yield client
+
+async def timed_get(http, url: str, **kwargs):
+    started = time.perf_counter()
+    response = await http.get(url, **kwargs)
+    return response, time.perf_counter() - started
+
+@pytest.mark.anyio
+async def test_concurrent_misses_share_one_download(storage, http):
+    storage.blobs["docs/report.pdf"] = (b"x" * 1024, "application/pdf")
+    storage.delay = DOWNLOAD_DELAY
+    started = time.perf_counter()
+    responses = await asyncio.gather(*[http.get("/api/files/docs/report.pdf") for _ in range(20)])
+    elapsed = time.perf_counter() - started
+    assert all(response.status_code == 200 for response in responses)
+    assert storage.downloads == ["docs/report.pdf"]
+    assert elapsed < DOWNLOAD_DELAY * 3
+
+@pytest.mark.anyio
+async def test_slow_download_does_not_block_other_requests(storage, http):
+    storage.blobs["docs/slow.bin"] = (b"s" * 1024, "application/octet-stream")
+    storage.blobs["docs/fast.bin"] = (b"f" * 16, "application/octet-stream")
+    await http.get("/api/files/docs/fast.bin")
+    storage.delay = DOWNLOAD_DELAY * 5
+    slow = asyncio.ensure_future(timed_get(http, "/api/files/docs/slow.bin"))
+    await asyncio.sleep(0.05)
+    latencies = [latency for _, latency in await asyncio.gather(*[
+        timed_get(http, "/api/files/docs/fast.bin") for _ in range(10)
+    ])]
+    assert not slow.done()
+    assert max(latencies) < DOWNLOAD_DELAY
+    response, _ = await slow
+    assert response.status_code == 200
+
+@pytest.mark.anyio
+async def test_cached_blob_is_served_without_download(storage, http):
+    storage.blobs["docs/a.txt"] = (b"hello", "text/plain")
+    first = await http.get("/api/files/docs/a.txt")
+    second = await http.get("/api/files/docs/a.txt")
+    assert (first.headers["x-cache"], second.headers["x-cache"]) == ("MISS", "HIT")
+    assert second.content == b"hello"
+    assert storage.downloads == ["docs/a.txt"]
+
+@pytest.mark.anyio
+async def test_missing_blob_returns_404(storage, http):
+    response = await http.get("/api/files/docs/missing.txt")
+    assert response.status_code == 404
+
+@pytest.mark.anyio
+async def test_oversized_upload_is_rejected_before_staging(storage, http, monkeypatch):
+    monkeypatch.setattr(files, "MAX_UPLOAD_BYTES", 1024)
+    monkeypatch.setattr(files, "MULTIPART_OVERHEAD_BYTES", 1024)
+    response = await http.post("/api/files/upload", files={"file": ("big.txt", b"x" * 100_000, "text/plain")})
+    assert response.status_code == 413
+    assert not storage.staged and not storage.blobs
+
+@pytest.mark.anyio
+async def test_upload_within_limit_is_stored(storage, http):
+    response = await http.post("/api/files/upload", files={"file": ("notes.txt", b"hello", "text/plain")})
+    assert response.status_code == 200
+    assert storage.blobs[response.json()["blob_path"]] == (b"hello", "text/plain")
+
+@pytest.mark.anyio
+async def test_missing_rendition_falls_back_to_original(storage, http):
+    storage.blobs["p/images/photo.png"] = (b"original", "image/png")
+    for _ in range(2):
+        response = await http.get("/api/files/p/images/photo.png", params={"size": "thumb"})
+        assert response.content == b"original"
+        assert response.headers["content-disposition"] == "inline; filename=photo.png"
+    assert files.blob_cache.get(hashlib.md5(files.rendition_path("p/images/photo.png", "thumb").encode()).hexdigest()) is None
+    assert storage.downloads == ["p/images/photo.thumb.webp", "p/images/photo.png"]
\ No newline at end of file
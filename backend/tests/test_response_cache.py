@@ -0,0 +1,56 @@
+import time
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from models.database import PRIMARY_STICKY_COOKIE
+from services import response_cache
+from services.response_cache import MemoryResponseCache, cached_json, invalidate_responses
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = MemoryResponseCache(1024 * 1024, 60)
+    monkeypatch.setattr(response_cache, "response_cache", cache)
+    monkeypatch.setattr(response_cache, "RESPONSE_CACHE_REPLICA_FILL_DELAY_SECONDS", 0.2)
+    return cache
+
+@pytest.fixture
+def app_state():
+    return {"value": 1, "builds": 0}
+
+@pytest.fixture
+def client(app_state):
+    app = FastAPI()
+
+    @app.get("/items")
+    def items(request: Request, replica: bool = False):
+        request.state.db_replica = "replica-1" if replica else None
+
+        def build():
+            app_state["builds"] += 1
+            return {"value": app_state["value"]}
+
+        return cached_json(request, ("items",), build)
+
+    return TestClient(app)
+
+def test_primary_reads_fill_the_cache_right_after_a_write(cache, client, app_state):
+    invalidate_responses("items")
+    assert client.get("/items").json() == {"value": 1}
+    assert client.get("/items").json() == {"value": 1}
+    assert app_state["builds"] == 1
+
+def test_replica_reads_do_not_fill_the_cache_until_the_lag_window_passes(cache, client, app_state):
+    invalidate_responses("items")
+    client.get("/items", params={"replica": True})
+    client.get("/items", params={"replica": True})
+    assert app_state["builds"] == 2
+    time.sleep(0.25)
+    client.get("/items", params={"replica": True})
+    client.get("/items", params={"replica": True})
+    assert app_state["builds"] == 3
+
+def test_clients_pinned_to_the_primary_skip_cached_entries(cache, client, app_state):
+    client.get("/items")
+    app_state["value"] = 2
+    client.cookies.set(PRIMARY_STICKY_COOKIE, str(time.time() + 60))
+    assert client.get("/items").json() == {"value": 2}
\ No newline at end of file
@@ -16,6 +16,8 @@ interface DetailDrawerProps {
 const DetailDrawer: React.FC<DetailDrawerProps> = ({ assetId, onClose, onEdit, onDelete }) => {
   const [asset, setAsset] = useState<any>(null);
   const [history, setHistory] = useState<any[]>([]);
+  const [historyCursor, setHistoryCursor] = useState<string | null>(null);
+  const [loadingHistory, setLoadingHistory] = useState(false);
   const [loading, setLoading] = useState(true);
   const [uploading, setUploading] = useState(false);
   const fileInputRef = useRef<HTMLInputElement>(null);
@@ -31,7 +33,8 @@ const DetailDrawer: React.FC<DetailDrawerProps> = ({ assetId, onClose, onEdit, o
         assetAPI.getAssetHistory(assetId),
       ]);
       setAsset(assetResponse.data);
-      setHistory(historyResponse.data);
+      setHistory(historyResponse.data.items);
+      setHistoryCursor(historyResponse.data.next_cursor);
     } catch (error) {
       console.error('Error loading asset details:', error);
     } finally {
@@ -39,6 +42,19 @@ const DetailDrawer: React.FC<DetailDrawerProps> = ({ assetId, onClose, onEdit, o
     }
   };
 
+  const loadMoreHistory = async () => {
+    setLoadingHistory(true);
+    try {
+      const response = await assetAPI.getAssetHistory(assetId, historyCursor);
+      setHistory((current) => [...current, ...response.data.items]);
+      setHistoryCursor(response.data.next_cursor);
+    } catch (error) {
+      console.error('Error loading asset history:', error);
+    } finally {
+      setLoadingHistory(false);
+    }
+  };
+
   const handleImageUpload = async (event: React.ChangeEvent<HTMLInputElement>) => {
     const file = event.target.files?.[0];
     if (!file) return;
@@ -73,9 +89,9 @@ const DetailDrawer: React.FC<DetailDrawerProps> = ({ assetId, onClose, onEdit, o
     }
   };
 
-  const getImageUrl = (imagePath: string) => {
+  const getImageUrl = (imagePath: string, size: 'thumb' | 'medium' | 'full' = 'full') => {
     const apiBase = process.env.NEXT_PUBLIC_API_URL || '';
-    return `${apiBase}/api/files/${encodeURIComponent(imagePath)}`;
+    return `${apiBase}/api/files/${encodeURIComponent(imagePath)}?size=${size}`;
   };
 
   if (loading) {
@@ -90,7 +106,7 @@ const DetailDrawer: React.FC<DetailDrawerProps> = ({ assetId, onClose, onEdit, o
           <div className={styles.headerLeft}>
             <div className={styles.assetAvatar}>
               {asset.image_path ? (
-                <img src={getImageUrl(asset.image_path)} alt={asset.name} style={{ width: '100%', height: '100%', objectFit: 'cover', borderRadius: '0.75rem' }} />
+                <img src={getImageUrl(asset.image_path, 'thumb')} alt={asset.name} style={{ width: '100%', height: '100%', objectFit: 'cover', borderRadius: '0.75rem' }} />
               ) : (
                 <FiPackage />
               )}
@@ -112,7 +128,7 @@ const DetailDrawer: React.FC<DetailDrawerProps> = ({ assetId, onClose, onEdit, o
             <div className={styles.imageUploadContainer}>
               {asset.image_path ? (
                 <div className={styles.imagePreview}>
-                  <img src={getImageUrl(asset.image_path)} alt={asset.name} />
+                  <img src={getImageUrl(asset.image_path, 'medium')} alt={asset.name} />
                 </div>
               ) : (
                 <div className={styles.imagePlaceholder}>
@@ -223,6 +239,11 @@ const DetailDrawer: React.FC<DetailDrawerProps> = ({ assetId, onClose, onEdit, o
                 </div>
               ))}
             </div>
+            {historyCursor && (
+              <Button variant="outlined" size="small" onClick={loadMoreHistory} disabled={loadingHistory}>
+                {loadingHistory ? 'Loading...' : 'Load more'}
+              </Button>
+            )}
           </div>
         </div>
       </div>
@@ -1,9 +1,11 @@
 import axios from 'axios';
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || '';
+const HISTORY_PAGE_SIZE = 20;
 
 export const apiClient = axios.create({
   baseURL: API_BASE_URL,
+  withCredentials: true,
   headers: {
     'Content-Type': 'application/json',
   },
@@ -11,11 +13,17 @@ export const apiClient = axios.create({
 
 export const assetAPI = {
   getAssets: (filters?: any) => apiClient.get('/api/assets', { params: filters }),
+  getAssetChanges: (since?: string | null) =>
+    apiClient.get('/api/assets/changes', { params: since ? { since } : {} }),
+  searchAssets: (q: string, params?: any) => apiClient.get('/api/assets/search', { params: { q, ...params } }),
   getAsset: (id: number) => apiClient.get(`/api/assets/${id}`),
   createAsset: (data: any) => apiClient.post('/api/assets', data),
   updateAsset: (id: number, data: any) => apiClient.put(`/api/assets/${id}`, data),
   deleteAsset: (id: number) => apiClient.delete(`/api/assets/${id}`),
-  getAssetHistory: (id: number) => apiClient.get(`/api/assets/${id}/history`),
+  getAssetHistory: (id: number, cursor?: string | null) =>
+    apiClient.get(`/api/assets/${id}/history`, {
+      params: cursor ? { limit: HISTORY_PAGE_SIZE, cursor } : { limit: HISTORY_PAGE_SIZE },
+    }),
 };
 
 export const categoryAPI = {
@@ -27,6 +35,7 @@ export const categoryAPI = {
 
 export const dashboardAPI = {
   getSummary: () => apiClient.get('/api/dashboard/summary'),
+  streamSummary: () => new EventSource(`${API_BASE_URL}/api/dashboard/stream`, { withCredentials: true }),
 };
 
 export default apiClient;
\ No newline at end of file
@@ -0,0 +1,56 @@
+const DB_NAME = 'vault';
+const STORE_NAME = 'assetSnapshot';
+const SNAPSHOT_KEY = 'assets';
+
+export interface AssetSnapshot {
+  token: string;
+  assets: any[];
+}
+
+const openDatabase = (): Promise<IDBDatabase | null> => {
+  if (typeof indexedDB === 'undefined') {
+    return Promise.resolve(null);
+  }
+  return new Promise((resolve) => {
+    const request = indexedDB.open(DB_NAME, 1);
+    request.onupgradeneeded = () => request.result.createObjectStore(STORE_NAME);
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => resolve(null);
+  });
+};
+
+const withStore = async <T>(mode: IDBTransactionMode, action: (store: IDBObjectStore) => IDBRequest | void): Promise<T | null> => {
+  const db = await openDatabase();
+  if (!db) {
+    return null;
+  }
+  return new Promise((resolve) => {
+    const transaction = db.transaction(STORE_NAME, mode);
+    const request = action(transaction.objectStore(STORE_NAME));
+    transaction.oncomplete = () => {
+      db.close();
+      resolve(request ? (request.result as T) ?? null : null);
+    };
+    transaction.onerror = () => {
+      db.close();
+      resolve(null);
+    };
+    transaction.onabort = () => {
+      db.close();
+      resolve(null);
+    };
+  });
+};
+
+export const loadAssetSnapshot = () =>
+  withStore<AssetSnapshot>('readonly', (store) => store.get(SNAPSHOT_KEY));
+
+export const saveAssetSnapshot = (snapshot: AssetSnapshot) =>
+  withStore('readwrite', (store) => {
+    store.put(snapshot, SNAPSHOT_KEY);
+  });
+
+export const clearAssetSnapshot = () =>
+  withStore('readwrite', (store) => {
+    store.delete(SNAPSHOT_KEY);
+  });
\ No newline at end of file
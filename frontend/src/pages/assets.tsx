@@ -1,4 +1,4 @@
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import { FiPlus } from 'react-icons/fi';
 import { format } from 'date-fns';
 import Button from '../components/common/Button';
@@ -6,6 +6,7 @@ import EntityTableCard from '../components/tables/EntityTableCard';
 import DetailDrawer from '../components/details/DetailDrawer';
 import AssetForm from '../components/forms/AssetForm';
 import { assetAPI } from '../lib/api';
+import { clearAssetSnapshot, loadAssetSnapshot, saveAssetSnapshot } from '../lib/assetSnapshot';
 import styles from '../styles/Dashboard.module.css';
 import tableStyles from '../styles/EntityTableCard.module.css';
 
@@ -13,24 +14,80 @@ const AssetsPage = () => {
   const [assets, setAssets] = useState<any[]>([]);
   const [filteredAssets, setFilteredAssets] = useState<any[]>([]);
   const [searchValue, setSearchValue] = useState('');
+  const [searchResults, setSearchResults] = useState<any[] | null>(null);
   const [statusFilter, setStatusFilter] = useState('');
   const [selectedAsset, setSelectedAsset] = useState<number | null>(null);
   const [isFormOpen, setIsFormOpen] = useState(false);
   const [loading, setLoading] = useState(true);
+  const changeToken = useRef<string | null>(null);
+  const syncedAssets = useRef<any[]>([]);
 
   useEffect(() => {
     loadAssets();
   }, []);
 
+  useEffect(() => {
+    const query = searchValue.trim();
+    if (!query) {
+      setSearchResults(null);
+      return;
+    }
+    const timer = setTimeout(async () => {
+      try {
+        const response = await assetAPI.searchAssets(query, { status: statusFilter || undefined, limit: 100 });
+        setSearchResults(response.data.items);
+      } catch (error) {
+        console.error('Error searching assets:', error);
+      }
+    }, 250);
+    return () => clearTimeout(timer);
+  }, [searchValue, statusFilter, assets]);
+
   useEffect(() => {
     filterAssets();
-  }, [assets, searchValue, statusFilter]);
+  }, [assets, searchResults, statusFilter]);
 
   const loadAssets = async () => {
     try {
-      const response = await assetAPI.getAssets();
-      setAssets(response.data);
-    } catch (error) {
+      if (changeToken.current === null) {
+        // The snapshot holds the list and the token it was synced to, so a
+        // new visit only pulls the changes made since then.
+        const snapshot = await loadAssetSnapshot();
+        if (snapshot) {
+          changeToken.current = snapshot.token;
+          syncedAssets.current = snapshot.assets;
+          setAssets(snapshot.assets);
+          setLoading(false);
+        }
+      }
+      const changed: any[] = [];
+      const deleted: number[] = [];
+      const resync = changeToken.current === null;
+      let hasMore = true;
+      while (hasMore) {
+        const response = await assetAPI.getAssetChanges(changeToken.current);
+        changed.push(...response.data.changed);
+        deleted.push(...response.data.deleted);
+        changeToken.current = response.data.next_token;
+        hasMore = response.data.has_more;
+      }
+      if (!resync && !changed.length && !deleted.length) {
+        return;
+      }
+      const byId = new Map((resync ? [] : syncedAssets.current).map((asset) => [asset.id, asset]));
+      changed.forEach((asset) => byId.set(asset.id, asset));
+      deleted.forEach((id) => byId.delete(id));
+      const merged = Array.from(byId.values()).sort((a, b) => a.id - b.id);
+      syncedAssets.current = merged;
+      setAssets(merged);
+      await saveAssetSnapshot({ token: changeToken.current as string, assets: merged });
+    } catch (error: any) {
+      if (error?.response?.status === 410) {
+        changeToken.current = null;
+        syncedAssets.current = [];
+        await clearAssetSnapshot();
+        return loadAssets();
+      }
       console.error('Error loading assets:', error);
     } finally {
       setLoading(false);
@@ -38,16 +95,13 @@ const AssetsPage = () => {
   };
 
   const filterAssets = () => {
-    let filtered = [...assets];
-
-    if (searchValue) {
-      filtered = filtered.filter(
-        (asset) =>
-          asset.name.toLowerCase().includes(searchValue.toLowerCase()) ||
-          asset.serial_number?.toLowerCase().includes(searchValue.toLowerCase())
-      );
+    if (searchResults) {
+      setFilteredAssets(searchResults);
+      return;
     }
 
+    let filtered = [...assets];
+
     if (statusFilter) {
       filtered = filtered.filter((asset) => asset.status === statusFilter);
     }
@@ -12,6 +12,20 @@ const Dashboard = () => {
 
   useEffect(() => {
     loadSummary();
+
+    const stream = dashboardAPI.streamSummary();
+    stream.addEventListener('summary', (event) => {
+      const data = JSON.parse((event as MessageEvent).data);
+      setSummary((current: any) => ({ ...current, ...data }));
+    });
+    stream.addEventListener('activity', (event) => {
+      const activities = JSON.parse((event as MessageEvent).data);
+      setSummary((current: any) => ({
+        ...current,
+        recent_activities: [...activities, ...(current?.recent_activities || [])].slice(0, 10),
+      }));
+    });
+    return () => stream.close();
   }, []);
 
   const loadSummary = async () => {